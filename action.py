@@ -1,6 +1,7 @@
 from copy import copy
 from schema import Role, Scope
 from result import Success, Failure, NotUnderstoodFailure
+from grammar import Grammar
 
 
 class InvalidRoleConfiguration(Exception):
@@ -40,6 +41,7 @@ class Action:
                  aliases=None, role_scopes=None, role_messages=None):
 
         self.game = game
+        self.id = None
         self.name = name
         self.callback = callback
         self.preposition_roles = preposition_roles
@@ -86,6 +88,7 @@ class Action:
                 self.role_messages[role] = role_messages[role]
 
         self.consequences = dict()
+        self.grammar = Grammar.for_action(self)
 
     @classmethod
     def create(cls, game, name,
@@ -107,11 +110,12 @@ class Action:
         a = Action(game, name, callback, preposition_roles, direct_object_role, indirect_object_role,
                    required_roles, permissive_roles,
                    aliases, role_scopes, role_messages)
-        game.vocabulary.register_verb(a)
+        a.id = game.vocabulary.register_verb(a)
         return a
 
     def add_alias(self, alias):
         self.aliases.append(alias)
+        self.game.vocabulary.add_verb_alias(self.id, alias)
 
     def schema_lookup(self, schema, necessary_result, necessary_location):
         if necessary_result:
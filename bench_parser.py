@@ -0,0 +1,99 @@
+import sys
+import time
+from command import Command, NounPhrase, PrepPhrase
+from route import Route
+from vocabulary import Tag
+from result import Success, NotUnderstoodFailure
+from game import Game
+
+INPUTS = ['look', 'n', 'get key', 'get the golden key', 'hit fox with sword', 'put apple in trunk',
+          'give villager the apple', 'eat apple core', 'open sturdy door', 'unlock door with steel key',
+          'drop the heavy thing', 'ask townsfolk for bread', 'get the the apple', 'wave at villager']
+
+
+def legacy_parse(command, tokens):
+    command.verb = tokens[0].word
+    command.action = command.vocabulary.lookup_verb_by_name(command.verb)
+    preposition = None
+    determiner = None
+    direct_object_tags = Tag.NONE
+    modifiers = set()
+    for token in tokens[1:]:
+        word = token.word
+        tags = token.tags
+        if tags & Tag.DETERMINER:
+            if determiner:
+                return NotUnderstoodFailure()
+            else:
+                determiner = word
+                continue
+        if tags & Tag.PREPOSITION:
+            if preposition:
+                return NotUnderstoodFailure()
+            else:
+                preposition = word
+                continue
+        if tags & Tag.NOUN:
+            determiner = None
+            if preposition:
+                command.prep_phrases.append(PrepPhrase(NounPhrase(word, modifiers), preposition))
+                preposition = None
+            elif command.direct_object:
+                if command.action.get_indirect_object_role():
+                    command.indirect_object = command.direct_object
+                    command.direct_object = NounPhrase(word, modifiers)
+                    direct_object_tags = tags
+                else:
+                    previous_noun = command.direct_object.noun
+                    if direct_object_tags & Tag.ADJECTIVE:
+                        modifiers = command.direct_object.modifiers
+                        modifiers.add(previous_noun)
+                        command.direct_object = NounPhrase(word, modifiers)
+                        direct_object_tags = tags
+            else:
+                command.direct_object = NounPhrase(word, modifiers)
+                direct_object_tags = tags
+            modifiers = set()
+            continue
+        if tags & Tag.ADJECTIVE:
+            modifiers.add(word)
+            continue
+        return NotUnderstoodFailure(word)
+    return Success("Syntax check: passed")
+
+
+def compiled_parse(command, tokens):
+    return command.parse_input(None, tokens)
+
+
+def summary(command):
+    def phrase(p):
+        return None if p is None else (p.noun, tuple(sorted(p.modifiers)))
+    return (phrase(command.direct_object), phrase(command.indirect_object),
+            tuple((p.preposition, phrase(p.noun_phrase)) for p in command.prep_phrases))
+
+
+def run(game, parse, token_lists, rounds):
+    start = time.perf_counter()
+    for i in range(rounds):
+        for tokens in token_lists:
+            parse(Command(game), tokens)
+    return time.perf_counter() - start
+
+
+def main(rounds=2000):
+    game = Game(route=Route(prompt=None))
+    token_lists = [game.lexer.tokenize(line) for line in INPUTS]
+    for tokens in token_lists:
+        legacy, compiled = Command(game), Command(game)
+        legacy_parse(legacy, tokens)
+        compiled_parse(compiled, tokens)
+        assert summary(legacy) == summary(compiled), [t.word for t in tokens]
+    parses = rounds * len(token_lists)
+    for name, parse in (('legacy', legacy_parse), ('compiled', compiled_parse)):
+        elapsed = run(game, parse, token_lists, rounds)
+        print("{:>8}: {:>9.0f} parses/s".format(name, parses / elapsed))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
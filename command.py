@@ -1,5 +1,8 @@
 from schema import Scope, Role, Schema
+from vocabulary import PartOfSpeech
 from result import *
+from parsecache import ParseCache, ParsedCommand
+from grammar import Op
 
 
 class ProximityException(Exception):
@@ -74,55 +77,37 @@ class Command:
         if not unambiguous_match:
             modifiers = phrase.modifiers
             if len(modifiers) > 0:
-                matches_by_modifier = \
-                    [m for m in matches if set(modifiers) <=
-                     set([self.vocabulary.lookup_adjective(a).name for a in m.modifiers])]
+                matches_by_modifier = self.vocabulary.lookup_by_modifiers(noun, modifiers)
                 if len(matches_by_modifier) == 1:
                     unambiguous_match = matches_by_modifier[0]
                 elif len(matches_by_modifier) > 1:
                     matches = matches_by_modifier
 
-        matches_in_inventory = [m for m in matches if player.in_inventory(m)]
-        matches_in_location = [m for m in matches if player.in_current_location(m)]
-        proximate_matches = matches_in_inventory + matches_in_location
-        container_matches = [m for m in matches if player.nearby_container_having(m)]
-        creature_matches = [m for m in matches if player.nearby_creature_having(m)]
-        nearby_matches = proximate_matches + container_matches + creature_matches
-        if scope == Scope.INVENTORY:
-            available_matches = matches_in_inventory
-        elif scope == Scope.PROXIMITY:
-            available_matches = proximate_matches
-        elif scope == Scope.EXTERNAL:
-            available_matches = matches_in_location + container_matches + creature_matches
-        else:  # Scope.NEARBY
-            available_matches = nearby_matches
-
-        if unambiguous_match and unambiguous_match in available_matches:
-            return unambiguous_match
-        elif unambiguous_match and not unambiguous_match.traits.ubiquitous \
-                and unambiguous_match not in available_matches:
-            if unambiguous_match in nearby_matches:
-                article = 'the'
-            elif unambiguous_match.traits.composite:
-                article = 'any'
-            else:
-                article = unambiguous_match.article()
+        visibility = player.visibility
+        available_ids = visibility.reachable(scope)
+        if unambiguous_match:
+            if unambiguous_match.id in available_ids or unambiguous_match.traits.ubiquitous:
+                return unambiguous_match
             if scope == Scope.INVENTORY:
+                if unambiguous_match.id in visibility.reachable(Scope.NEARBY):
+                    article = 'the'
+                elif unambiguous_match.traits.composite:
+                    article = 'any'
+                else:
+                    article = unambiguous_match.article()
                 raise OwnershipException(phrase.text(), article)
             else:
                 raise ProximityException(phrase.text())
-        elif not unambiguous_match and len(available_matches) == 0:
-            if scope == Scope.INVENTORY:
-                raise OwnershipException(phrase.text(), article='a')
-            else:
-                raise ProximityException(phrase.text())
-        elif not unambiguous_match:
-            if len(available_matches) == 1:
-                unambiguous_match = available_matches[0]
-            elif len(available_matches) > 1:
-                raise AmbiguousNounException(available_matches)
 
-        return unambiguous_match
+        available_matches = [m for m in matches if m.id in available_ids]
+        if len(available_matches) == 1:
+            return available_matches[0]
+        elif len(available_matches) > 1:
+            raise AmbiguousNounException(available_matches)
+        elif scope == Scope.INVENTORY:
+            raise OwnershipException(phrase.text(), article='a')
+        else:
+            raise ProximityException(phrase.text())
 
     def assign_roles(self):
 
@@ -157,62 +142,73 @@ class Command:
 
         return Success("Roles assigned successfully")
 
-    def parse_input(self, input_text):
+    def resolve(self, input_text):
+        cache = self.game.parse_cache
+        key = ParseCache.normalize(input_text)
+        stamp = ParseCache.stamp(self.game)
+        parsed = cache.get(key, stamp)
+        self.input_text = input_text
+        if parsed is not None:
+            return parsed.restore(self)
+        result = self.parse_input(input_text)
+        if result.success:
+            result = self.assign_roles()
+        cache.put(key, stamp, ParsedCommand(self, result))
+        return result
+
+    def parse_input(self, input_text, tokens=None):
 
         vocabulary = self.vocabulary
-        words = input_text.split()
+        if tokens is None:
+            tokens = self.game.lexer.tokenize(input_text)
         self.input_text = input_text
+        if len(tokens) == 0:
+            return NotUnderstoodFailure()
 
-        self.verb = words[0]
+        self.verb = tokens[0].word
         try:
             self.action = vocabulary.lookup_verb_by_name(self.verb)
         except (KeyError, IndexError):
-            return Failure("I don't know how to {}!".format(self.verb))
-
+            r = Failure("I don't know how to {}!".format(self.verb))
+            suggestions = vocabulary.suggest_spelling(self.verb, {PartOfSpeech.VERB})
+            if suggestions:
+                r.append(" " + suggestion_text(suggestions))
+            return r
+
+        grammar = self.action.grammar
+        row = 0
         preposition = None
-        determiner = None
         modifiers = set()
-        for word in words[1:]:
-            if vocabulary.is_determiner(word):
-                if determiner:
-                    return NotUnderstoodFailure()
-                else:
-                    determiner = word
-                    continue
-            if vocabulary.is_preposition(word):
-                if preposition:
-                    return NotUnderstoodFailure()
-                else:
-                    preposition = word
-                    continue
-            if vocabulary.is_noun(word):
-                determiner = None
-                if preposition:
-                    prep_phrase = PrepPhrase(NounPhrase(word, modifiers), preposition)
-                    self.prep_phrases.append(prep_phrase)
-                    preposition = None
-                elif self.direct_object:
-                    # Two nouns in a row: is first noun an indirect object?
-                    if self.action.get_indirect_object_role():
-                        self.indirect_object = self.direct_object
-                        self.direct_object = NounPhrase(word, modifiers)
-                    # ... if this verb doesn't accept indirect objects, the first 'noun'
-                    # might be acting as an adjective-like specifier (e.g., "apple core")
-                    else:
-                        previous_noun = self.direct_object.noun
-                        if vocabulary.is_adjective(previous_noun):
-                            modifiers = self.direct_object.modifiers
-                            modifiers.add(previous_noun)
-                            self.direct_object = NounPhrase(word, modifiers)
-                else:
-                    self.direct_object = NounPhrase(word, modifiers)
-                modifiers = set()
-                continue
-            if vocabulary.is_adjective(word):
+        for token in tokens[1:]:
+            word = token.word
+            row, op = grammar.step(row, token.tags)
+            if op == Op.DIRECT_OBJECT:
+                self.direct_object = NounPhrase(word, modifiers)
+            elif op == Op.MODIFIER:
                 modifiers.add(word)
                 continue
-
-            return NotUnderstoodFailure(word)
+            elif op == Op.NONE:
+                continue
+            elif op == Op.PREPOSITION:
+                preposition = word
+                continue
+            elif op == Op.PREP_PHRASE:
+                self.prep_phrases.append(PrepPhrase(NounPhrase(word, modifiers), preposition))
+                preposition = None
+            elif op == Op.SHIFT_TO_INDIRECT:
+                self.indirect_object = self.direct_object
+                self.direct_object = NounPhrase(word, modifiers)
+            elif op == Op.MERGE_AS_MODIFIER:
+                # "apple core": the previous noun acts as a modifier of this one
+                merged = self.direct_object.modifiers
+                merged.add(self.direct_object.noun)
+                self.direct_object = NounPhrase(word, merged)
+            elif op == Op.FAIL:
+                return NotUnderstoodFailure()
+            elif op == Op.UNKNOWN_WORD:
+                return NotUnderstoodFailure(word, vocabulary.suggest_spelling(
+                    word, {PartOfSpeech.NOUN, PartOfSpeech.ADJECTIVE}))
+            modifiers = set()
         return Success("Syntax check: passed")
 
     def execute(self):
@@ -0,0 +1,71 @@
+class TraitDependency:
+
+    def __init__(self, thing, key):
+        self.thing = thing
+        self.key = key
+        self.condition = None
+
+    def watch(self, condition, creature):
+        if self.condition is None:
+            self.condition = condition
+            self.thing.watch(self.changed)
+
+    def changed(self, thing, key):
+        if key == self.key:
+            self.condition.invalidate()
+
+
+class LoadDependency:
+
+    def __init__(self):
+        self.condition = None
+        self.watching = set()
+
+    def watch(self, condition, creature):
+        inventory = creature.inventory
+        if inventory.id not in self.watching:
+            self.condition = condition
+            self.watching.add(inventory.id)
+            inventory.watch(self.changed)
+
+    def changed(self, inventory, key):
+        if key == 'load':
+            self.condition.invalidate(inventory.owner.id)
+
+
+class Condition:
+
+    def __init__(self, test, *dependencies):
+        self.test = test
+        self.dependencies = dependencies
+        self.results = dict()
+        self.listeners = []
+        self.hits = 0
+        self.misses = 0
+
+    def listen(self, listener):
+        self.listeners.append(listener)
+
+    def invalidate(self, creature_id=None):
+        if creature_id is None:
+            self.results.clear()
+        else:
+            self.results.pop(creature_id, None)
+        for listener in self.listeners:
+            listener(self, creature_id)
+
+    def evaluate(self, game, creature):
+        result = bool(self.test(game, creature))
+        if self.dependencies:
+            self.misses += 1
+            for dependency in self.dependencies:
+                dependency.watch(self, creature)
+            self.results[creature.id] = result
+        return result
+
+    def __call__(self, game, creature):
+        result = self.results.get(creature.id)
+        if result is None:
+            return self.evaluate(game, creature)
+        self.hits += 1
+        return result
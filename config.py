@@ -17,6 +17,7 @@ from player import Player
 from action import Action
 from creature import Creature
 from consumable import Edible, Drinkable
+from condition import Condition, TraitDependency, LoadDependency
 from json import JSONEncoder
 
 
@@ -76,7 +77,7 @@ class Config:
                       aliases=['score'], callback=lambda schema: schema[Role.AGENT].game.status())
         Action.create(game, name='exit',
                       aliases=['quit', 'end', 'done'],
-                      callback=lambda schema: game.exit_game())
+                      callback=lambda schema: game.quit())
         Action.create(game, name='diagnose',
                       callback=lambda schema: schema[Role.AGENT].diagnose())
         Action.create(game, name='wait',
@@ -363,12 +364,12 @@ class Config:
 
         front_porch.add_exit(direction.north, patio)
         front_porch.add_exit(direction.south, street,
-                             condition=lambda g, p: not metal_gate.traits.closed,
+                             condition=Condition(lambda g, p: not metal_gate.traits.closed,
+                                                 TraitDependency(metal_gate, 'closed')),
                              after=lambda g, p, l, d: end_section("section one", g, p, 50),
                              fail_result=Failure("The metal gate blocks your way"))
 
-        def too_small_check(g, p):
-            return p.inventory.used_capacity() <= 25
+        too_small_check = Condition(lambda g, p: p.inventory.used_capacity() <= 25, LoadDependency())
         too_small_result = Failure("Your load is too large to fit through the small hole")
 
         east_tower.add_exit(direction.up, roof,
@@ -395,7 +396,8 @@ class Config:
         north_tower.add_exit(direction.south, paneled_room)
         north_tower.add_exit(direction.up, balcony,
                              description="Stairs lead up to a door high above",
-                             condition=lambda g, p: not sturdy_door.traits.closed,
+                             condition=Condition(lambda g, p: not sturdy_door.traits.closed,
+                                                 TraitDependency(sturdy_door, 'closed')),
                              fail_result=Failure("A sturdy door blocks the way"))
         balcony.add_exit(direction.down, north_tower)
 
@@ -674,5 +676,6 @@ class Config:
         game.player = Player(game)
         start_location = self.setup_items(game)
         game.player.location = start_location
+        game.events.subscribe(start_location, game.player)
 
 
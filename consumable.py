@@ -17,8 +17,10 @@ class Consumable(Item):
 
     def consume_from(self, location):
         r = location.remove_item(self)
-        if r.success and self.consumed is not None:
-            location.add_item(self.consumed)
+        if r.success:
+            if self.consumed is not None:
+                location.add_item(self.consumed)
+            self.destroy()
         return r
 
 
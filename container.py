@@ -1,11 +1,13 @@
 from traits import Traits
 from item import Item
 from result import Success, Failure
+from orderedset import OrderedSet
 
 
 class Container(Item):
 
     MAX_CAPACITY = 999
+    DEBUG_CAPACITY = False
     DEFAULT_TRAITS = Traits(closed=True)
 
     def __init__(self, game, name, description,
@@ -15,7 +17,11 @@ class Container(Item):
         self.vocab = game.vocabulary
         self.put_preposition = 'in'
         self.capacity = capacity
-        self.items = []
+        self.owner = None
+        self.items = OrderedSet()
+        self.load = 0
+        self.reachable = frozenset()
+        self.reachable_version = self.version
         self.add_patient_role('put')
         self.add_patient_role('get')
         if not self.traits.surface:
@@ -24,19 +30,63 @@ class Container(Item):
             self.add_patient_role('lock')
             self.add_patient_role('unlock')
 
+    def parent(self):
+        if self.holder is None:
+            return self.owner
+        return self.holder
+
+    def reachable_ids(self):
+        if self.reachable_version != self.version:
+            reachable = set(self.items)
+            for item_id in self.items:
+                reachable.update(self.vocab.lookup_noun(item_id).exposed_ids())
+            self.reachable = frozenset(reachable)
+            self.reachable_version = self.version
+        return self.reachable
+
+    def exposed_ids(self):
+        if self.traits.closed:
+            return frozenset()
+        return self.reachable_ids()
+
     def item_count(self):
         return len(self.items)
 
-    def used_capacity(self):
+    def recompute_used_capacity(self):
         used_capacity = 0
         for item_id in self.items:
             item = self.vocab.lookup_noun(item_id)
             used_capacity += item.size
         return used_capacity
 
+    def used_capacity(self):
+        if Container.DEBUG_CAPACITY:
+            assert self.load == self.recompute_used_capacity(), \
+                "Load of {} is out of step with its contents".format(self.full_name())
+        return self.load
+
+    def adjust_load(self, delta):
+        self.load += delta
+        self.notify_watchers('load')
+
     def remaining_capacity(self):
         return self.capacity - self.used_capacity()
 
+    def insert_item(self, item):
+        self.items.add(item.id)
+        item.holder = self
+        item.record_change()
+        self.touch()
+        self.adjust_load(item.size)
+
+    def extract_item(self, item):
+        self.items.remove(item.id)
+        if item.holder is self:
+            item.holder = None
+        item.record_change()
+        self.touch()
+        self.adjust_load(-item.size)
+
     def add_item(self, item, force=False):
         if not force and self.traits.closed:
             result = Failure("The " + self.full_name() + " is closed")
@@ -51,7 +101,7 @@ class Container(Item):
                 result = Failure("Sorry, the {} won't fit {} the {}"
                                  .format(item.full_name(), self.put_preposition, self.full_name()))
             else:
-                self.items.append(item.id)
+                self.insert_item(item)
                 result = Success("Okay, the {} {} now {} the {}"
                                  .format(item.full_name(),
                                          item.existential(),
@@ -63,7 +113,7 @@ class Container(Item):
             result = Failure("The " + self.full_name() + " is closed")
         else:
             if item.id in self.items:
-                self.items.remove(item.id)
+                self.extract_item(item)
                 result = Success("You remove the " + item.name + " from the " + self.full_name())
             else:
                 result = Failure("The {} {}n't {} the {}!"
@@ -78,9 +128,9 @@ class Container(Item):
         if item_count == 0:
             description.append(", containing nothing")
         elif len(self.items) == 1:
-            item = self.vocab.lookup_noun(self.items[0])
+            item = self.vocab.lookup_noun(self.items.first())
             description.append(", containing {} {}"
-                               .format(item.article(), item.name))
+                               .format(item.article(), item.full_name()))
         else:
             description.append(", containing: ")
             for item_id in self.items:
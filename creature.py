@@ -35,6 +35,7 @@ class Creature(Item):
         self.inventory = Container(game, name + '-inv', name + "'s items",
                                    traits=Traits(closed=False),
                                    capacity=strength)
+        self.inventory.owner = self
         self.add_patient_role('greet')
         self.add_patient_role('wave')
         self.add_patient_role('smile')
@@ -49,6 +50,13 @@ class Creature(Item):
     def remove_item(self, item):
         self.inventory.remove_item(item)
 
+    def destroy(self):
+        super(Creature, self).destroy()
+        self.inventory.destroy()
+
+    def exposed_ids(self):
+        return self.inventory.reachable_ids()
+
     def add_wanted_item(self, item):
         self.wanted_items.append(item)
 
@@ -130,7 +138,7 @@ class Creature(Item):
             or self.movement_frequency <= game.turns - self.last_movement
 
     def random_walk(self, game, location):
-        passages = location.available_exits(game)
+        passages = game.room_graph.open_exits(location)
         if len(passages) > 0:
             p = random.choice(passages)
             p.go(game, self)
@@ -140,15 +148,16 @@ class Creature(Item):
         self.last_movement = game.turns
         start_location = self.location
         new_location = self.movement_strategy(game, start_location)
-        if start_location != player.location \
-                and new_location == player.location:
-            r = self.entry_action(game, player)
-        elif start_location == player.location \
-                and new_location != player.location:
-            r = self.exit_action(game, player)
-        else:
-            r = None
-        return r
+        self.announce_move(game, start_location, new_location)
+        return None
+
+    def announce_move(self, game, start_location, new_location):
+        if new_location != start_location:
+            events = game.events
+            if events.has_subscribers(start_location):
+                events.publish(start_location, lambda observer: self.exit_action(game, observer))
+            if events.has_subscribers(new_location):
+                events.publish(new_location, lambda observer: self.entry_action(game, observer))
 
     def update(self, game, player):
         r = None
@@ -167,8 +176,8 @@ class Creature(Item):
         r = super(Creature, self).describe()
         item_count = len(self.inventory.items)
         if item_count == 1:
-            item = self.vocabulary.lookup_noun(self.inventory.items[0])
-            r.append(", carrying {} {}".format(item.article(), item.name))
+            item = self.vocabulary.lookup_noun(self.inventory.items.first())
+            r.append(", carrying {} {}".format(item.article(), item.full_name()))
         elif item_count > 1:
             r.append(", carrying: ")
             for item_id in self.inventory.items:
@@ -0,0 +1,31 @@
+class EventBus:
+
+    def __init__(self):
+        self.subscribers = dict()
+        self.subscriptions = dict()
+
+    def subscribe(self, location, observer):
+        self.unsubscribe(observer)
+        self.subscribers.setdefault(location.id, []).append(observer)
+        self.subscriptions[observer.id] = location.id
+
+    def unsubscribe(self, observer):
+        location_id = self.subscriptions.pop(observer.id, None)
+        if location_id is not None:
+            observers = self.subscribers[location_id]
+            observers.remove(observer)
+            if len(observers) == 0:
+                del self.subscribers[location_id]
+
+    def relocate(self, observer, destination):
+        if observer.id in self.subscriptions:
+            self.subscribe(destination, observer)
+
+    def has_subscribers(self, location):
+        return location is not None and location.id in self.subscribers
+
+    def publish(self, location, event):
+        for observer in self.subscribers.get(location.id, ()):
+            r = event(observer)
+            if r:
+                observer.notify(r)
@@ -4,27 +4,55 @@ from vocabulary import Vocabulary
 from result import Success, WON_GAME
 from config import Config
 from command import Command
+from lexer import Lexer
+from roomgraph import RoomGraph
+from parsecache import ParseCache
+from events import EventBus
+from shard import ShardedSimulation
 from route import ConsoleRoute
 
 
+class TurnResult:
+
+    def __init__(self, message, success, score, turns, events, finished):
+        self.message = message
+        self.success = success
+        self.score = score
+        self.turns = turns
+        self.events = events
+        self.finished = finished
+
+
 class Game:
 
     HISTORY_LENGTH = 10
 
-    def __init__(self, name='the Game', prompt='>> ', route=None):
+    def __init__(self, name='the Game', prompt='>> ', route=None, lexicon=None):
         self.name = name
         self.prompt = prompt
         self.route = route if route else ConsoleRoute(prompt=self.prompt)
         self.config = Config('/tmp/gameConfig')
         self.player = None
         self.vocabulary = Vocabulary()
+        self.lexer = Lexer(self.vocabulary)
+        self.room_graph = RoomGraph(self.vocabulary)
+        self.events = EventBus()
+        self.parse_cache = ParseCache()
+        self.move_log = None
+        self.journal = None
+        self.shards = None
         self.command_history = deque(maxlen=Game.HISTORY_LENGTH + 1)
         self.turns = 0
         self.score = 0
+        self.finished = False
+        self.lexicon = lexicon
         self.setup()
 
     def setup(self):
+        if self.lexicon is not None:
+            self.vocabulary.adopt(self.lexicon)
         self.config.setup(self)
+        self.lexicon = self.vocabulary.freeze()
 
     def help(self):
         r = Success("Available commands are: \n")
@@ -35,6 +63,10 @@ class Game:
         self.route.send_output(self.status().message)
         exit(0)
 
+    def quit(self):
+        self.finished = True
+        return self.status()
+
     def history(self):
         r = Success("Recent command history: \n")
         if len(self.command_history) > 0:
@@ -49,6 +81,9 @@ class Game:
         location.remove_item(creature)
         destination.add_item(creature)
         creature.location = destination
+        self.events.relocate(creature, destination)
+        if self.move_log is not None:
+            self.move_log.append((creature.id, location.id, destination.id))
 
     def is_player(self, creature):
         return creature.id == self.player.id
@@ -61,43 +96,90 @@ class Game:
         r = Success("You have a score of {} after {} turns".format(self.score, self.turns))
         return r
 
+    def enable_sharding(self, region_count):
+        self.disable_sharding()
+        self.shards = ShardedSimulation(self, region_count)
+
+    def disable_sharding(self):
+        if self.shards:
+            self.shards.close()
+            self.shards = None
+
     def update_game(self):
         self.turns += 1
-        living_creatures = self.get_living_creatures()
-        if len(living_creatures) > 0:
-            for c in living_creatures:
-                r = c.update(self, self.player)
-                if r:
-                    self.route.send_output(r.message)
-                if not self.player.is_alive():
-                    self.route.send_output("You have died ... ")
-                    self.exit_game()
+        self.room_graph.refresh_conditions(self)
+        if self.shards:
+            self.shards.begin_turn()
+            living_creatures = self.shards.local_creatures()
+        else:
+            living_creatures = self.get_living_creatures()
+        events = []
+        for c in living_creatures:
+            r = c.update(self, self.player)
+            if r:
+                events.append(r.message)
+            if self.collect_notifications(events):
+                break
+        if self.shards:
+            self.shards.finish_turn()
+            self.collect_notifications(events)
+        return events
+
+    def collect_notifications(self, events):
+        events.extend(n.message for n in self.player.take_notifications())
+        if not self.player.is_alive() and not self.finished:
+            events.append("You have died ... ")
+            self.finished = True
+        return self.finished
 
     def init_game(self):
         self.route.set_banner(self.name)
         self.route.send_output(self.player.look())
 
+    def execute_turn(self, player_input):
+        command = Command(self)
+        result = command.resolve(player_input)
+        if result.success:
+            result = command.execute()
+        self.command_history.append(command)
+        if len(self.command_history) > Game.HISTORY_LENGTH:
+            self.command_history.popleft()
+        message = result.message
+        if result == WON_GAME:
+            self.finished = True
+        events = [] if self.finished else self.update_game()
+        return TurnResult(message, result.success, self.score, self.turns, events, self.finished)
+
+    def execute_line(self, line):
+        turns = []
+        for player_input in self.lexer.split_commands(line):
+            turn = self.execute_turn(player_input)
+            turns.append(turn)
+            if turn.success is False or self.finished:
+                break
+        return turns
+
+    def run_commands(self, commands):
+        for line in commands:
+            if self.finished:
+                break
+            for turn in self.execute_line(line):
+                yield turn
+
     def manage_turn(self):
         player_input = self.route.receive_input()
-        if len(player_input) > 0:
-            command = Command(self)
-            syntax_result = command.parse_input(player_input)
-            if syntax_result.success:
-                semantic_result = command.assign_roles()
-                if semantic_result.success:
-                    result = command.execute()
-                else:
-                    result = semantic_result
-            else:
-                result = syntax_result
-            self.command_history.append(command)
-            if len(self.command_history) > Game.HISTORY_LENGTH:
-                self.command_history.popleft()
-            self.route.send_output(result.message)
-            if result == WON_GAME:
+        turns = self.execute_line(player_input)
+        if turns:
+            output = []
+            for turn in turns:
+                output.append(turn.message)
+                output.extend(turn.events)
+            self.route.send_output("\n".join(output))
+        if self.finished:
+            if self.player.is_alive():
                 exit(0)
             else:
-                self.update_game()
+                self.exit_game()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+from vocabulary import Tag
+
+
+class TokenClass:
+
+    DETERMINER = 0
+    PREPOSITION = 1
+    NOUN = 2
+    NOUN_OR_ADJECTIVE = 3
+    ADJECTIVE = 4
+    UNKNOWN = 5
+
+    COUNT = 6
+
+    @staticmethod
+    def from_tags(tags):
+        if tags & Tag.DETERMINER:
+            return TokenClass.DETERMINER
+        if tags & Tag.PREPOSITION:
+            return TokenClass.PREPOSITION
+        if tags & Tag.NOUN:
+            if tags & Tag.ADJECTIVE:
+                return TokenClass.NOUN_OR_ADJECTIVE
+            return TokenClass.NOUN
+        if tags & Tag.ADJECTIVE:
+            return TokenClass.ADJECTIVE
+        return TokenClass.UNKNOWN
+
+
+TOKEN_CLASSES = tuple(TokenClass.from_tags(tags) for tags in range((Tag.KNOWN_WORD | Tag.VERB) + 1))
+
+
+class Op:
+
+    NONE = 0
+    PREPOSITION = 1
+    PREP_PHRASE = 2
+    DIRECT_OBJECT = 3
+    SHIFT_TO_INDIRECT = 4
+    MERGE_AS_MODIFIER = 5
+    DROP = 6
+    MODIFIER = 7
+    FAIL = 8
+    UNKNOWN_WORD = 9
+
+
+class Grammar:
+
+    PREPOSITION_PENDING = 1
+    DETERMINER_PENDING = 2
+    NO_OBJECT = 0
+    OBJECT = 4
+    ADJECTIVE_OBJECT = 8
+    STATE_COUNT = 12
+
+    compiled = dict()
+
+    def __init__(self, accepts_indirect_object):
+        self.accepts_indirect_object = accepts_indirect_object
+        table = []
+        for state in range(Grammar.STATE_COUNT):
+            for token_class in range(TokenClass.COUNT):
+                next_state, op = self.transition(state, token_class)
+                table.append((next_state * TokenClass.COUNT, op))
+        self.table = tuple(table)
+
+    @classmethod
+    def for_action(cls, action):
+        accepts_indirect_object = bool(action.indirect_object_role)
+        grammar = cls.compiled.get(accepts_indirect_object)
+        if grammar is None:
+            grammar = Grammar(accepts_indirect_object)
+            cls.compiled[accepts_indirect_object] = grammar
+        return grammar
+
+    def transition(self, state, token_class):
+        preposition = state & Grammar.PREPOSITION_PENDING
+        determiner = state & Grammar.DETERMINER_PENDING
+        direct_object = state & (Grammar.OBJECT | Grammar.ADJECTIVE_OBJECT)
+        if token_class == TokenClass.DETERMINER:
+            if determiner:
+                return state, Op.FAIL
+            return state | Grammar.DETERMINER_PENDING, Op.NONE
+        if token_class == TokenClass.PREPOSITION:
+            if preposition:
+                return state, Op.FAIL
+            return state | Grammar.PREPOSITION_PENDING, Op.PREPOSITION
+        if token_class in (TokenClass.NOUN, TokenClass.NOUN_OR_ADJECTIVE):
+            if token_class == TokenClass.NOUN_OR_ADJECTIVE:
+                noun_object = Grammar.ADJECTIVE_OBJECT
+            else:
+                noun_object = Grammar.OBJECT
+            if preposition:
+                return direct_object, Op.PREP_PHRASE
+            if not direct_object:
+                return noun_object, Op.DIRECT_OBJECT
+            if self.accepts_indirect_object:
+                return noun_object, Op.SHIFT_TO_INDIRECT
+            if direct_object == Grammar.ADJECTIVE_OBJECT:
+                return noun_object, Op.MERGE_AS_MODIFIER
+            return direct_object, Op.DROP
+        if token_class == TokenClass.ADJECTIVE:
+            return state, Op.MODIFIER
+        return state, Op.UNKNOWN_WORD
+
+    def step(self, row, tags):
+        return self.table[row + TOKEN_CLASSES[tags]]
@@ -10,6 +10,7 @@ class Item(VisibleThing):
                  aliases=None, traits=None, size=0, value=0):
         self.traits = Traits.merge(self, traits, Item.DEFAULT_TRAITS)
         super(Item, self).__init__(game, name, description, aliases)
+        self._size = 0
         self.size = size
         self.value = value
         if self.traits.portable:
@@ -20,3 +21,14 @@ class Item(VisibleThing):
             self.add_theme_role('get')
             self.add_theme_role('give')
             self.add_theme_role('ask')
+
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        delta = size - self._size
+        self._size = size
+        if self.holder is not None and delta != 0:
+            self.holder.adjust_load(delta)
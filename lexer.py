@@ -0,0 +1,69 @@
+import re
+from vocabulary import PartOfSpeech, Tag
+
+COMMAND_SEPARATORS = re.compile(r'[.,]|\bthen\b', re.IGNORECASE)
+
+
+class Token:
+
+    def __init__(self, word, tags):
+        self.word = word
+        self.tags = tags
+
+    def __repr__(self):
+        return "Token({!r}, {})".format(self.word, self.tags)
+
+
+class Lexer:
+
+    def __init__(self, vocabulary):
+        self.vocabulary = vocabulary
+
+    def expand_verb(self, word):
+        vocabulary = self.vocabulary
+        expansion = vocabulary.expand_prefix(PartOfSpeech.VERB, word)
+        if expansion:
+            return expansion
+        suggestions = vocabulary.suggest_spelling(word, {PartOfSpeech.VERB})
+        if len(suggestions) == 1:
+            return suggestions[0]
+        return word
+
+    def expand_word(self, word):
+        vocabulary = self.vocabulary
+        noun = vocabulary.expand_prefix(PartOfSpeech.NOUN, word)
+        adjective = vocabulary.expand_prefix(PartOfSpeech.ADJECTIVE, word)
+        if noun and adjective and noun != adjective:
+            return word
+        elif noun:
+            return noun
+        elif adjective:
+            return adjective
+        suggestions = vocabulary.suggest_spelling(word, {PartOfSpeech.NOUN, PartOfSpeech.ADJECTIVE})
+        if len(suggestions) == 1:
+            return suggestions[0]
+        return word
+
+    @staticmethod
+    def split_commands(line):
+        commands = [command.strip() for command in COMMAND_SEPARATORS.split(line)]
+        return [command for command in commands if command]
+
+    def tokenize(self, input_text):
+        word_tags = self.vocabulary.word_tags
+        tokens = []
+        for word in input_text.split():
+            tags = word_tags(word)
+            if len(tokens) == 0:
+                if not tags & Tag.VERB:
+                    word = self.expand_verb(word)
+                    tags = word_tags(word)
+            elif not tags & Tag.KNOWN_WORD:
+                word = self.expand_word(word)
+                tags = word_tags(word)
+            tokens.append(Token(word, tags))
+        return tokens
+
+    def tokenize_batch(self, lines):
+        for line in lines:
+            yield self.tokenize(line)
@@ -8,6 +8,8 @@ class Location(Container):
 
     DEFAULT_TRAITS = Traits(closed=False)
 
+    free_passage = Passage.free_passage
+
     def __init__(self, game, name, description, aliases=None, traits=None, size=0, value=0):
         traits = Traits.merge(self, traits, Location.DEFAULT_TRAITS)
         super(Location, self).__init__(game, name, description, aliases=aliases, traits=traits,
@@ -15,20 +17,18 @@ class Location(Container):
         self.vocab = game.vocabulary
         self.exits = dict()
         self.visited = False
+        game.room_graph.add_location(self)
 
     def to_json(self):
         return vars(self)
 
-    @staticmethod
-    def free_passage(game, player):
-        return True
-
     def add_exit(self, direction, destination, description=None, condition=None, fail_result=None, after=None):
         if not condition:
             condition = Location.free_passage
         passage = Passage(self.game, self.name + '-' + direction.name,
                           self, direction, destination, description, condition, fail_result, after)
         self.exits[direction.id] = passage
+        self.game.room_graph.add_passage(passage)
 
     def available_exits(self, game):
         return [self.exits[d] for d in self.exits if self.exits[d].condition(game, game.player)]
@@ -2,6 +2,7 @@ class Modifier:
 
     def __init__(self, game, name, aliases=None):
         self.game = game
+        self.id = None
         self.name = name
         if aliases is None:
             self.aliases = []
@@ -11,5 +12,12 @@ class Modifier:
     @classmethod
     def create(cls, game, name, aliases=None):
         m = Modifier(game, name, aliases)
-        game.vocabulary.register_adjective(m)
+        m.id = game.vocabulary.register_adjective(m)
         return m
+
+    @classmethod
+    def intern(cls, game, name):
+        for m in game.vocabulary.lookup_adjective_by_name(name):
+            if m.name == name:
+                return m
+        return cls.create(game, name)
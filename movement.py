@@ -0,0 +1,106 @@
+from location import Location
+from creature import Creature
+
+
+class MovementStrategy:
+
+    def __init__(self, creature):
+        self.creature = creature
+
+    def __call__(self, game, location):
+        destination = self.choose_destination(game, location)
+        if destination is not None and destination is not location:
+            passage = game.room_graph.next_passage(location, destination)
+            if passage is not None:
+                passage.go(game, self.creature)
+                return self.creature.location
+        return self.fallback(game, location)
+
+    def choose_destination(self, game, location):
+        return None
+
+    def fallback(self, game, location):
+        return location
+
+
+class RandomWalk(MovementStrategy):
+
+    def __call__(self, game, location):
+        return self.creature.random_walk(game, location)
+
+
+class ChasePlayer(MovementStrategy):
+
+    def choose_destination(self, game, location):
+        return game.player.location
+
+
+class Flee(MovementStrategy):
+
+    def __call__(self, game, location):
+        graph = game.room_graph
+        player_location = game.player.location
+        farthest = graph.distance(location, player_location)
+        if farthest is None:
+            return location
+        choice = None
+        for passage in graph.open_exits(location):
+            distance = graph.distance(self.creature.vocabulary.lookup_noun(passage.destination), player_location)
+            if distance is None or distance > farthest:
+                choice = passage
+                if distance is None:
+                    break
+                farthest = distance
+        if choice is not None:
+            choice.go(game, self.creature)
+        return self.creature.location
+
+
+class Patrol(MovementStrategy):
+
+    def __init__(self, creature, route):
+        super(Patrol, self).__init__(creature)
+        self.route = route
+        self.stop = 0
+
+    def choose_destination(self, game, location):
+        if location is self.route[self.stop]:
+            self.stop = (self.stop + 1) % len(self.route)
+        return self.route[self.stop]
+
+
+class SeekItem(MovementStrategy):
+
+    def __init__(self, creature, fallback=None):
+        super(SeekItem, self).__init__(creature)
+        self.wander = fallback
+
+    @staticmethod
+    def location_of(item):
+        holder = item.parent()
+        while holder is not None and not isinstance(holder, Location):
+            if isinstance(holder, Creature):
+                return holder.location
+            holder = holder.parent()
+        return holder
+
+    def choose_destination(self, game, location):
+        graph = game.room_graph
+        closest = None
+        closest_distance = None
+        for item in self.creature.wanted_items:
+            if self.creature.in_inventory(item):
+                continue
+            item_location = SeekItem.location_of(item)
+            if item_location is None:
+                continue
+            distance = graph.distance(location, item_location)
+            if distance is not None and (closest_distance is None or distance < closest_distance):
+                closest = item_location
+                closest_distance = distance
+        return closest
+
+    def fallback(self, game, location):
+        if self.wander:
+            return self.wander(game, location)
+        return location
@@ -0,0 +1,37 @@
+class OrderedSet:
+
+    def __init__(self, iterable=()):
+        self.entries = dict.fromkeys(iterable)
+
+    def __contains__(self, value):
+        return value in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __eq__(self, other):
+        if isinstance(other, OrderedSet):
+            return list(self.entries) == list(other.entries)
+        else:
+            return NotImplemented
+
+    def __repr__(self):
+        return "OrderedSet({!r})".format(list(self.entries))
+
+    def add(self, value):
+        self.entries[value] = None
+
+    def remove(self, value):
+        del self.entries[value]
+
+    def discard(self, value):
+        self.entries.pop(value, None)
+
+    def first(self):
+        return next(iter(self.entries))
+
+    def to_json(self):
+        return list(self.entries)
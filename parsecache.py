@@ -0,0 +1,65 @@
+from collections import OrderedDict
+from schema import Schema
+
+
+class ParsedCommand:
+
+    def __init__(self, command, result):
+        self.result = result
+        self.verb = command.verb
+        self.action = command.action
+        self.direct_object = command.direct_object
+        self.indirect_object = command.indirect_object
+        self.prep_phrases = list(command.prep_phrases)
+        self.roles = dict(command.schema.roles)
+
+    def restore(self, command):
+        command.verb = self.verb
+        command.action = self.action
+        command.direct_object = self.direct_object
+        command.indirect_object = self.indirect_object
+        command.prep_phrases = list(self.prep_phrases)
+        command.schema = Schema(self.roles)
+        return self.result
+
+
+class ParseCache:
+
+    MAX_ENTRIES = 256
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def normalize(input_text):
+        return ' '.join(input_text.split())
+
+    @staticmethod
+    def stamp(game):
+        player = game.player
+        location = player.location
+        return game.vocabulary.version, location.id, location.version, player.inventory.version
+
+    def get(self, key, stamp):
+        cached = self.entries.get(key)
+        if cached is None or cached[0] != stamp:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return cached[1]
+
+    def put(self, key, stamp, parsed):
+        self.entries[key] = (stamp, parsed)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
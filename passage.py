@@ -17,18 +17,34 @@ class Passage(Thing):
         self.direction = direction.id
         self.destination = destination.id
         self.description = description
-        self.condition = condition
+        self._condition = condition
+        self.conditional = condition is not Passage.free_passage
         self.after = after
         if fail_result:
             self.fail_result = fail_result
         else:
             self.fail_result = Passage.DEFAULT_FAIL_RESULT
 
+    @staticmethod
+    def free_passage(game, player):
+        return True
+
+    @property
+    def condition(self):
+        return self._condition
+
+    @condition.setter
+    def condition(self, condition):
+        self._condition = condition
+        self.conditional = condition is not Passage.free_passage
+        self.game.room_graph.replace_condition(self)
+
     def set_direction(self, direction):
         self.direction = direction.id
 
     def set_destination(self, destination):
         self.destination = destination.id
+        self.game.room_graph.add_passage(self)
 
     def go(self, game, creature):
         if self.condition(game, creature):
@@ -4,6 +4,7 @@ from schema import Role
 from result import Success, Failure, ProximityFailure, OwnershipFailure
 from container import Container
 from creature import Creature
+from visibility import VisibilityCache
 
 
 class Player(Creature):
@@ -17,6 +18,16 @@ class Player(Creature):
             aliases=None, health=100, strength=75, dexterity=80, location=location)
         self.game = game
         self.vocab = game.vocabulary
+        self.visibility = VisibilityCache(self)
+        self.notifications = []
+
+    def notify(self, result):
+        self.notifications.append(result)
+
+    def take_notifications(self):
+        notifications = self.notifications
+        self.notifications = []
+        return notifications
 
     def is_valid_for_role(self, role, attempted_action):
         if role == Role.AGENT:
@@ -30,27 +41,27 @@ class Player(Creature):
     def is_nearby(self, target):
         return self.in_inventory(target) or self.in_current_location(target)
 
+    def is_reachable(self, target):
+        return self.is_nearby(target) or self.nearby_container_having(target) is not None
+
     def nearby_container_having(self, target):
-        found_container = None
-        nearby_item_ids = self.inventory.items + self.location.items
-        nearby_items = [self.game.vocabulary.lookup_noun(i) for i in nearby_item_ids]
-        nearby_containers = [c for c in nearby_items if isinstance(c, Container) and not c.traits.closed]
-        for c in nearby_containers:
-            if target.id in c.items:
-                found_container = c
-                break
-        return found_container
+        container = target.holder
+        node = container
+        while node is not None and node.owner is None and not node.traits.closed:
+            if self.is_nearby(node):
+                return container
+            node = node.holder
+        return None
 
     def nearby_creature_having(self, target):
-        found_creature = None
-        nearby_item_ids = self.inventory.items + self.location.items
-        nearby_items = [self.game.vocabulary.lookup_noun(i) for i in nearby_item_ids]
-        nearby_creatures = [c for c in nearby_items if isinstance(c, Creature) and c != self]
-        for c in nearby_creatures:
-            if target.id in c.inventory.items:
-                found_creature = c
-                break
-        return found_creature
+        node = target.holder
+        while node is not None and node.owner is None and not node.traits.closed:
+            node = node.holder
+        if node is not None and node.owner is not None:
+            creature = node.owner
+            if creature != self and self.is_nearby(creature):
+                return creature
+        return None
 
     def go(self, direction):
         if direction.id in self.location.exits:
@@ -132,7 +143,7 @@ class Player(Creature):
                         elif item_count == 1:
                             r = Success("Opening the {} reveals a {}"
                                         .format(container.full_name(),
-                                                self.vocab.lookup_noun(container.items[0]).full_name()))
+                                                self.vocab.lookup_noun(container.items.first()).full_name()))
                         else:
                             r = Success("Opening the {} reveals: ".format(container.full_name()))
                             for item_id in container.items:
@@ -234,7 +245,7 @@ class Player(Creature):
         if isinstance(container, Creature):
             r = self.ask_for(container, item)
         else:
-            if not self.is_nearby(container):
+            if not self.is_reachable(container):
                 r = ProximityFailure(container.full_name())
             else:
                 r1 = container.remove_item(item)
@@ -332,12 +343,13 @@ class Player(Creature):
                 else:
                     r = Success(("You deal the {} a fatal blow. It falls to the ground dead, "
                                 + "and its body dissolves into the hungry earth").format(creature.full_name()))
-                    for item_id in creature.inventory.items:
+                    for item_id in list(creature.inventory.items):
                         item = self.game.vocabulary.lookup_noun(item_id)
                         creature.inventory.remove_item(item)
                         self.location.add_item(item)
                     self.location.remove_item(creature, force=True)
                     creature.location = None
+                    creature.destroy()
         return r
 
     def throw(self, throwable, target=None):
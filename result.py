@@ -1,6 +1,15 @@
 import random
 
 
+def suggestion_text(suggestions):
+    quoted = ["'{}'".format(s) for s in suggestions]
+    if len(quoted) == 1:
+        text = quoted[0]
+    else:
+        text = ', '.join(quoted[:-1]) + ' or ' + quoted[-1]
+    return "Did you mean {}?".format(text)
+
+
 class Result:
 
     def __init__(self, message, success=None):
@@ -66,11 +75,13 @@ class ProximityFailure(Failure):
 
 class NotUnderstoodFailure(Failure):
 
-    def __init__(self, invalid_word=None):
+    def __init__(self, invalid_word=None, suggestions=None):
         if invalid_word:
             message = "Sorry, I don't know what you mean by '{}'".format(invalid_word)
         else:
             message = "Sorry, I didn't understand that"
+        if suggestions:
+            message += ". " + suggestion_text(suggestions)
         super(NotUnderstoodFailure, self).__init__(message)
 
 
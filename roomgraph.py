@@ -0,0 +1,266 @@
+from array import array
+from collections import deque
+from condition import Condition
+
+
+class RoomGraph:
+
+    MAX_CACHED_TREES = 256
+
+    def __init__(self, vocabulary):
+        self.vocabulary = vocabulary
+        self.node_index = dict()
+        self.location_ids = array('L')
+        self.offsets = array('i', [0])
+        self.targets = array('i')
+        self.sources = array('i')
+        self.passages = array('L')
+        self.conditional = bytearray()
+        self.conditional_edges = array('i')
+        self.blocked = bytearray()
+        self.volatile_edges = array('i')
+        self.edge_of = dict()
+        self.watched_passages = set()
+        self.condition_passages = dict()
+        self.dirty_passages = set()
+        self.player_id = None
+        self.reverse_offsets = array('i', [0])
+        self.reverse_edges = array('i')
+        self.trees = dict()
+        self.dirty = False
+        self.version = 0
+
+    def __len__(self):
+        return len(self.location_ids)
+
+    def add_location(self, location):
+        if location.id not in self.node_index:
+            self.node_index[location.id] = len(self.location_ids)
+            self.location_ids.append(location.id)
+            if not self.dirty:
+                self.offsets.append(self.offsets[-1])
+                self.reverse_offsets.append(self.reverse_offsets[-1])
+            for distance, next_edge in self.trees.values():
+                distance.append(-1)
+                next_edge.append(-1)
+            self.version += 1
+
+    def add_passage(self, passage):
+        for location_id in (passage.location, passage.destination):
+            self.add_location(self.vocabulary.lookup_noun(location_id))
+        self.invalidate()
+
+    def replace_condition(self, passage):
+        self.watched_passages.discard(passage.id)
+        self.dirty_passages.add(passage.id)
+        self.invalidate()
+
+    def invalidate(self):
+        self.dirty = True
+        self.version += 1
+
+    @staticmethod
+    def tree_affected(tree, removed, added):
+        distance = tree[0]
+        for source, target in removed:
+            if distance[target] >= 0 and distance[source] == distance[target] + 1:
+                return True
+        for source, target in added:
+            if distance[target] >= 0 and (distance[source] < 0 or distance[source] > distance[target] + 1):
+                return True
+        return False
+
+    def drop_trees(self, removed, added, conditional_only=False):
+        for key in list(self.trees):
+            if conditional_only and not key[1]:
+                continue
+            if RoomGraph.tree_affected(self.trees[key], removed, added):
+                del self.trees[key]
+
+    def watch_condition(self, passage):
+        condition = passage.condition
+        if not isinstance(condition, Condition):
+            return False
+        if passage.id not in self.watched_passages:
+            self.watched_passages.add(passage.id)
+            passage_ids = self.condition_passages.get(condition)
+            if passage_ids is None:
+                passage_ids = self.condition_passages[condition] = []
+                condition.listen(self.condition_changed)
+            passage_ids.append(passage.id)
+        return True
+
+    def condition_changed(self, condition, creature_id):
+        if creature_id is None or creature_id == self.player_id:
+            self.dirty_passages.update(self.condition_passages[condition])
+
+    def compile(self):
+        node_index = self.node_index
+        node_count = len(self.location_ids)
+        offsets = array('i', [0])
+        targets = array('i')
+        sources = array('i')
+        passages = array('L')
+        conditional = bytearray()
+        conditional_edges = array('i')
+        volatile_edges = array('i')
+        for index, location_id in enumerate(self.location_ids):
+            location = self.vocabulary.lookup_noun(location_id)
+            for passage in location.exits.values():
+                targets.append(node_index[passage.destination])
+                sources.append(index)
+                passages.append(passage.id)
+                if passage.conditional:
+                    conditional_edges.append(len(conditional))
+                    if not self.watch_condition(passage):
+                        volatile_edges.append(len(conditional))
+                conditional.append(passage.conditional)
+            offsets.append(len(targets))
+
+        reverse_offsets = array('i', [0]) * (node_count + 1)
+        for target in targets:
+            reverse_offsets[target + 1] += 1
+        for index in range(node_count):
+            reverse_offsets[index + 1] += reverse_offsets[index]
+        reverse_edges = array('i', [0]) * len(targets)
+        fill = array('i', reverse_offsets)
+        for edge, target in enumerate(targets):
+            reverse_edges[fill[target]] = edge
+            fill[target] += 1
+
+        edge_of = dict((passage_id, edge) for edge, passage_id in enumerate(self.passages))
+        renumbered = array('i', [-1]) * len(self.passages)
+        blocked = bytearray(len(targets))
+        removed = []
+        added = []
+        for edge, passage_id in enumerate(passages):
+            old_edge = edge_of.pop(passage_id, None)
+            if old_edge is not None:
+                if (self.targets[old_edge] == targets[edge] and self.sources[old_edge] == sources[edge]
+                        and self.conditional[old_edge] == conditional[edge]):
+                    renumbered[old_edge] = edge
+                    blocked[edge] = self.blocked[old_edge]
+                    continue
+                removed.append((self.sources[old_edge], self.targets[old_edge]))
+            added.append((sources[edge], targets[edge]))
+            if conditional[edge]:
+                self.dirty_passages.add(passage_id)
+        for old_edge in edge_of.values():
+            removed.append((self.sources[old_edge], self.targets[old_edge]))
+        self.drop_trees(removed, added)
+        for distance, next_edge in self.trees.values():
+            for node, edge in enumerate(next_edge):
+                if edge >= 0:
+                    next_edge[node] = renumbered[edge]
+
+        self.offsets = offsets
+        self.targets = targets
+        self.sources = sources
+        self.passages = passages
+        self.conditional = conditional
+        self.conditional_edges = conditional_edges
+        self.volatile_edges = volatile_edges
+        self.edge_of = dict((passage_id, edge) for edge, passage_id in enumerate(passages))
+        self.blocked = blocked
+        self.reverse_offsets = reverse_offsets
+        self.reverse_edges = reverse_edges
+        self.dirty = False
+
+    def ensure_compiled(self):
+        if self.dirty:
+            self.compile()
+
+    def refresh_conditions(self, game):
+        self.ensure_compiled()
+        self.player_id = game.player.id
+        edges = list(self.volatile_edges)
+        if self.dirty_passages:
+            edge_of = self.edge_of
+            edges.extend(edge_of[passage_id] for passage_id in self.dirty_passages if passage_id in edge_of)
+            self.dirty_passages = set()
+        removed = []
+        added = []
+        for edge in edges:
+            passage = self.vocabulary.lookup_noun(self.passages[edge])
+            blocked = 0 if passage.condition(game, game.player) else 1
+            if self.blocked[edge] != blocked:
+                self.blocked[edge] = blocked
+                if blocked:
+                    removed.append((self.sources[edge], self.targets[edge]))
+                else:
+                    added.append((self.sources[edge], self.targets[edge]))
+        if removed or added:
+            self.drop_trees(removed, added, conditional_only=True)
+            return True
+        return False
+
+    def is_passable(self, edge, include_conditional):
+        if self.conditional[edge]:
+            return include_conditional and not self.blocked[edge]
+        return True
+
+    def open_edges(self, location, include_conditional=True):
+        self.ensure_compiled()
+        index = self.node_index[location.id]
+        return [edge for edge in range(self.offsets[index], self.offsets[index + 1])
+                if self.is_passable(edge, include_conditional)]
+
+    def neighbours(self, location, include_conditional=True):
+        return [self.location_ids[self.targets[edge]] for edge in self.open_edges(location, include_conditional)]
+
+    def open_exits(self, location, include_conditional=True):
+        return [self.vocabulary.lookup_noun(self.passages[edge])
+                for edge in self.open_edges(location, include_conditional)]
+
+    def tree_toward(self, target_index, include_conditional):
+        key = (target_index, include_conditional)
+        tree = self.trees.get(key)
+        if tree is None:
+            node_count = len(self.location_ids)
+            distance = array('i', [-1]) * node_count
+            next_edge = array('i', [-1]) * node_count
+            distance[target_index] = 0
+            queue = deque([target_index])
+            while queue:
+                node = queue.popleft()
+                for k in range(self.reverse_offsets[node], self.reverse_offsets[node + 1]):
+                    edge = self.reverse_edges[k]
+                    if not self.is_passable(edge, include_conditional):
+                        continue
+                    source = self.sources[edge]
+                    if distance[source] < 0:
+                        distance[source] = distance[node] + 1
+                        next_edge[source] = edge
+                        queue.append(source)
+            if len(self.trees) >= RoomGraph.MAX_CACHED_TREES:
+                del self.trees[next(iter(self.trees))]
+            tree = (distance, next_edge)
+            self.trees[key] = tree
+        return tree
+
+    def distance(self, location, destination, include_conditional=True):
+        self.ensure_compiled()
+        distance, next_edge = self.tree_toward(self.node_index[destination.id], include_conditional)
+        d = distance[self.node_index[location.id]]
+        return d if d >= 0 else None
+
+    def next_passage(self, location, destination, include_conditional=True):
+        self.ensure_compiled()
+        distance, next_edge = self.tree_toward(self.node_index[destination.id], include_conditional)
+        edge = next_edge[self.node_index[location.id]]
+        if edge < 0:
+            return None
+        return self.vocabulary.lookup_noun(self.passages[edge])
+
+    def path(self, location, destination, include_conditional=True):
+        self.ensure_compiled()
+        distance, next_edge = self.tree_toward(self.node_index[destination.id], include_conditional)
+        index = self.node_index[location.id]
+        if distance[index] < 0:
+            return None
+        passages = []
+        while distance[index] > 0:
+            edge = next_edge[index]
+            passages.append(self.vocabulary.lookup_noun(self.passages[edge]))
+            index = self.targets[edge]
+        return passages
@@ -0,0 +1,289 @@
+import random
+from collections import deque
+from multiprocessing import get_all_start_methods, get_context
+from events import EventBus
+from thing import Thing
+
+PLAIN_TYPES = (int, float, str, bool, type(None))
+DERIVED_FIELDS = {'id', 'version', 'reachable_version', 'load', '_size', 'holder'}
+
+
+def partition_regions(graph, region_count):
+    graph.ensure_compiled()
+    node_count = len(graph)
+    order = []
+    seen = bytearray(node_count)
+    for start in range(node_count):
+        if seen[start]:
+            continue
+        seen[start] = 1
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            neighbours = [graph.targets[edge] for edge in range(graph.offsets[node], graph.offsets[node + 1])]
+            neighbours.extend(graph.sources[graph.reverse_edges[k]]
+                              for k in range(graph.reverse_offsets[node], graph.reverse_offsets[node + 1]))
+            for neighbour in neighbours:
+                if not seen[neighbour]:
+                    seen[neighbour] = 1
+                    queue.append(neighbour)
+    region_size = max(1, -(-node_count // region_count))
+    return dict((graph.location_ids[node], position // region_size) for position, node in enumerate(order))
+
+
+def find(vocabulary, thing_id):
+    if thing_id is None:
+        return None
+    try:
+        return vocabulary.lookup_noun(thing_id)
+    except KeyError:
+        return None
+
+
+def capture_state(vocabulary, thing_id):
+    thing = find(vocabulary, thing_id)
+    if thing is None:
+        return None
+    fields = dict()
+    references = dict()
+    for key, value in vars(thing).items():
+        if key in DERIVED_FIELDS:
+            continue
+        if type(value) in PLAIN_TYPES:
+            fields[key] = value
+        elif isinstance(value, Thing):
+            references[key] = value.id
+    traits = dict((key, value) for key, value in vars(thing.traits).items() if key != 'listener')
+    holder_id = thing.holder.id if thing.holder is not None else None
+    size = thing.size if '_size' in vars(thing) else None
+    strategy = getattr(thing, 'movement_strategy', None)
+    if strategy is None or hasattr(strategy, '__self__'):
+        strategy_fields = None
+    else:
+        strategy_fields = dict((key, value) for key, value in vars(strategy).items() if type(value) in PLAIN_TYPES)
+    return fields, references, traits, holder_id, size, strategy_fields
+
+
+def apply_state(game, thing_id, state):
+    vocabulary = game.vocabulary
+    thing = find(vocabulary, thing_id)
+    if thing is None:
+        return
+    if state is None:
+        thing.destroy()
+        return
+    fields, references, traits, holder_id, size, strategy_fields = state
+    for key, value in traits.items():
+        if getattr(thing.traits, key) != value:
+            setattr(thing.traits, key, value)
+    thing.__dict__.update(fields)
+    for key, reference_id in references.items():
+        thing.__dict__[key] = find(vocabulary, reference_id)
+    holder = find(vocabulary, holder_id)
+    previous = thing.holder
+    if holder is not previous:
+        if previous is not None and thing.id in previous.items:
+            previous.extract_item(thing)
+        thing.holder = None
+        if holder is not None:
+            holder.insert_item(thing)
+    if size is not None and size != thing.size:
+        thing.size = size
+    if strategy_fields:
+        vars(thing.movement_strategy).update(strategy_fields)
+    thing.touch()
+
+
+def run_worker(game, region, region_of, connection):
+    random.seed()
+    vocabulary = game.vocabulary
+    game.events = EventBus()
+    game.journal = None
+    game.move_log = None
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        turns, player_region, states = message
+        game.turns = turns
+        for thing_id, state in states:
+            apply_state(game, thing_id, state)
+        game.room_graph.refresh_conditions(game)
+        journal = game.journal = set()
+        game.move_log = []
+        if region != player_region:
+            for c in game.get_living_creatures():
+                if c.location is not None and region_of.get(c.location.id) == region:
+                    c.update(game, game.player)
+                    journal.add(c.id)
+        changes = [(thing_id, capture_state(vocabulary, thing_id))
+                   for thing_id in journal if thing_id not in region_of]
+        connection.send((changes, game.move_log))
+        game.journal = None
+        game.move_log = None
+    connection.close()
+
+
+class ShardedSimulation:
+
+    def __init__(self, game, region_count):
+        self.game = game
+        self.requested_regions = region_count
+        self.forking = 'fork' in get_all_start_methods()
+        self.connections = dict()
+        self.processes = dict()
+        self.forked_ids = dict()
+        self.local_ids = set()
+        self.player_region = None
+        self.start()
+
+    def start(self):
+        game = self.game
+        self.region_of = partition_regions(game.room_graph, self.requested_regions)
+        self.region_count = max(self.region_of.values()) + 1 if self.region_of else 0
+        self.graph_version = game.room_graph.version
+        self.pending = [set() for region in range(self.region_count)]
+        self.outdated = set()
+        self.local_regions = set()
+        self.local_ids = set()
+        if not self.forking:
+            self.local_regions.update(range(self.region_count))
+            return
+        game.journal = set()
+        for region in range(self.region_count):
+            self.fork(region)
+
+    def fork(self, region):
+        game = self.game
+        context = get_context('fork')
+        connection, worker_connection = context.Pipe()
+        process = context.Process(target=run_worker, daemon=True,
+                                  args=(game, region, self.region_of, worker_connection))
+        process.start()
+        worker_connection.close()
+        self.connections[region] = connection
+        self.processes[region] = process
+        self.forked_ids[region] = game.vocabulary.id_counter
+        self.pending[region] = set()
+
+    def drop(self, region):
+        connection = self.connections.pop(region)
+        process = self.processes.pop(region)
+        try:
+            connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        connection.close()
+        process.join(1)
+        if process.is_alive():
+            process.terminate()
+        self.local_regions.add(region)
+
+    def region_of_location(self, location):
+        if location is None:
+            return None
+        return self.region_of.get(location.id)
+
+    def region_of_thing(self, thing_id):
+        thing = find(self.game.vocabulary, thing_id)
+        while thing is not None and thing.id not in self.region_of:
+            thing = thing.parent()
+        return None if thing is None else self.region_of[thing.id]
+
+    def note_new_things(self, changed):
+        oldest = min(self.forked_ids[region] for region in self.connections)
+        for thing_id in changed:
+            if thing_id <= oldest:
+                continue
+            region = self.region_of_thing(thing_id)
+            if region in self.connections and thing_id > self.forked_ids[region]:
+                self.outdated.add(region)
+
+    def refork_outdated(self):
+        for region in list(self.outdated):
+            if region != self.player_region:
+                self.outdated.discard(region)
+                if region in self.connections:
+                    self.drop(region)
+                    self.local_regions.discard(region)
+                    self.fork(region)
+
+    def begin_turn(self):
+        game = self.game
+        if self.graph_version != game.room_graph.version:
+            self.close()
+            self.start()
+        self.player_region = self.region_of_location(game.player.location)
+        if not self.connections:
+            return
+        journal = game.journal
+        journal.update(self.local_ids)
+        journal.add(game.player.id)
+        self.note_new_things(journal)
+        self.refork_outdated()
+        vocabulary = game.vocabulary
+        states = dict()
+        for region, connection in list(self.connections.items()):
+            changed = self.pending[region] | journal
+            for thing_id in changed:
+                if thing_id not in states:
+                    states[thing_id] = capture_state(vocabulary, thing_id)
+            try:
+                connection.send((game.turns, self.player_region,
+                                 [(thing_id, states[thing_id]) for thing_id in changed]))
+            except (BrokenPipeError, OSError):
+                self.drop(region)
+            self.pending[region] = set()
+        game.journal = set()
+
+    def is_local(self, location):
+        region = self.region_of_location(location)
+        return region == self.player_region or region in self.local_regions
+
+    def local_creatures(self):
+        creatures = self.game.get_living_creatures()
+        if self.connections:
+            creatures = [c for c in creatures if self.is_local(c.location)]
+            self.local_ids = set(c.id for c in creatures)
+        return creatures
+
+    def finish_turn(self):
+        game = self.game
+        vocabulary = game.vocabulary
+        journal = game.journal
+        failed = set()
+        game.journal = None
+        for region, connection in list(self.connections.items()):
+            try:
+                states, moves = connection.recv()
+            except (EOFError, OSError):
+                self.drop(region)
+                failed.add(region)
+                continue
+            for thing_id, state in states:
+                apply_state(game, thing_id, state)
+            for other, pending in enumerate(self.pending):
+                if other != region:
+                    pending.update(thing_id for thing_id, state in states)
+            for creature_id, location_id, destination_id in moves:
+                creature = find(vocabulary, creature_id)
+                if creature is not None:
+                    location = find(vocabulary, location_id)
+                    destination = find(vocabulary, destination_id)
+                    game.events.relocate(creature, destination)
+                    creature.announce_move(game, location, destination)
+        game.journal = journal
+        if failed and failed != {self.player_region}:
+            for c in game.get_living_creatures():
+                if self.region_of_location(c.location) in failed - {self.player_region}:
+                    c.update(game, game.player)
+                    journal.add(c.id)
+
+    def close(self):
+        for region in list(self.connections):
+            self.drop(region)
+        self.game.journal = None
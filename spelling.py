@@ -0,0 +1,117 @@
+def edit_distance(a, b):
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+
+class SpellingIndex:
+
+    def __init__(self, max_distance=1):
+        self.max_distance = max_distance
+        self.words = set()
+        self.deletes = dict()
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def delete_variants(self, word):
+        variants = {word}
+        edge = {word}
+        for distance in range(self.max_distance):
+            next_edge = set()
+            for variant in edge:
+                for i in range(len(variant)):
+                    next_edge.add(variant[:i] + variant[i + 1:])
+            variants.update(next_edge)
+            edge = next_edge
+        return variants
+
+    def add(self, word):
+        if word in self.words:
+            return False
+        self.words.add(word)
+        for variant in self.delete_variants(word):
+            self.deletes.setdefault(variant, set()).add(word)
+        return True
+
+    def remove(self, word):
+        if word not in self.words:
+            return False
+        self.words.remove(word)
+        for variant in self.delete_variants(word):
+            words = self.deletes[variant]
+            words.discard(word)
+            if len(words) == 0:
+                del self.deletes[variant]
+        return True
+
+    def candidates(self, word):
+        candidates = set()
+        for variant in self.delete_variants(word):
+            candidates.update(self.deletes.get(variant, ()))
+        return candidates
+
+    def suggest(self, word):
+        return self.closest(word, self.candidates(word))
+
+    def closest(self, word, candidates):
+        suggestions = []
+        best_distance = self.max_distance
+        for candidate in candidates:
+            distance = edit_distance(word, candidate)
+            if distance < best_distance:
+                best_distance = distance
+                suggestions = [candidate]
+            elif distance == best_distance:
+                suggestions.append(candidate)
+        return sorted(suggestions)
+
+
+class SpellingOverlay:
+
+    def __init__(self, base):
+        self.base = base
+        self.max_distance = base.max_distance
+        self.added = SpellingIndex(base.max_distance)
+        self.removed = set()
+
+    def __len__(self):
+        return len(self.base) - len(self.removed) + len(self.added)
+
+    def __contains__(self, word):
+        return word in self.added or (word in self.base and word not in self.removed)
+
+    def add(self, word):
+        if word in self.removed:
+            self.removed.discard(word)
+            return True
+        if word in self.base:
+            return False
+        return self.added.add(word)
+
+    def remove(self, word):
+        if word in self.added:
+            return self.added.remove(word)
+        if word in self.base and word not in self.removed:
+            self.removed.add(word)
+            return True
+        return False
+
+    def candidates(self, word):
+        candidates = self.base.candidates(word) - self.removed
+        candidates.update(self.added.candidates(word))
+        return candidates
+
+    def suggest(self, word):
+        return self.base.closest(word, self.candidates(word))
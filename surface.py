@@ -17,7 +17,7 @@ class Surface(Container):
     def append_container_description(self, description):
         item_count = len(self.items)
         if item_count == 1:
-            item = self.vocab.lookup_noun(self.items[0])
+            item = self.vocab.lookup_noun(self.items.first())
             description.append(", with {} {} on it"
                                .format(item.article(), item.full_name()))
         elif item_count > 1:
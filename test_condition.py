@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+from condition import Condition, TraitDependency, LoadDependency
+from door import Door
+from item import Item
+from game import Game
+
+
+class TestCondition(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.player = self.game.player
+        self.calls = 0
+
+    def test_trait_dependency(self):
+        door = Door(self.game, name='hatch', description='A hatch')
+        door.traits.closed = True
+
+        def test(g, p):
+            self.calls += 1
+            return not door.traits.closed
+        condition = Condition(test, TraitDependency(door, 'closed'))
+        self.assertFalse(condition(self.game, self.player))
+        self.assertFalse(condition(self.game, self.player))
+        self.assertEqual(self.calls, 1)
+        door.traits.closed = False
+        self.assertTrue(condition(self.game, self.player))
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(condition.hits, 1)
+
+    def test_load_dependency(self):
+        def test(g, p):
+            self.calls += 1
+            return p.inventory.used_capacity() <= 10
+        condition = Condition(test, LoadDependency())
+        self.assertTrue(condition(self.game, self.player))
+        self.assertTrue(condition(self.game, self.player))
+        rock = Item(self.game, name='rock', description='A rock', size=20)
+        self.player.inventory.add_item(rock)
+        self.assertFalse(condition(self.game, self.player))
+        self.player.inventory.remove_item(rock)
+        self.assertTrue(condition(self.game, self.player))
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(condition.hits, 1)
+
+    def test_listeners_are_told_of_changes(self):
+        door = Door(self.game, name='hatch', description='A hatch')
+        door.traits.closed = False
+        changes = []
+        condition = Condition(lambda g, p: p.inventory.used_capacity() <= 10 and not door.traits.closed,
+                              TraitDependency(door, 'closed'), LoadDependency())
+        condition.listen(lambda c, creature_id: changes.append(creature_id))
+        self.assertTrue(condition(self.game, self.player))
+        door.traits.mobile = True
+        self.assertEqual(changes, [])
+        self.player.inventory.add_item(Item(self.game, name='rock', description='A rock', size=20))
+        self.assertEqual(changes, [self.player.id])
+        door.traits.closed = True
+        self.assertEqual(changes, [self.player.id, None])
+        self.assertFalse(condition(self.game, self.player))
+
+    def test_without_dependencies(self):
+        def test(g, p):
+            self.calls += 1
+            return True
+        condition = Condition(test)
+        condition(self.game, self.player)
+        condition(self.game, self.player)
+        self.assertEqual(self.calls, 2)
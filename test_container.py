@@ -2,7 +2,9 @@ from unittest import TestCase
 
 from item import Item
 from container import Container
+from creature import Creature
 from result import Result
+from game import Game
 
 
 class TestContainer(TestCase):
@@ -49,3 +51,57 @@ class TestContainer(TestCase):
         actual = self.chest.remove_item(self.sword)
         self.assertEqual(expected, actual)
 
+
+
+class TestContainerInWorld(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.chest = Container(self.game, name='chest', description='An oak chest', size=20, capacity=15)
+        self.chest.traits.closed = False
+
+    def test_describe_single_modified_item(self):
+        sword = Item(self.game, name='sword', description='An iron sword', size=8)
+        sword.add_modifier('iron')
+        self.chest.add_item(sword)
+        self.assertEqual(self.chest.describe().message, "An oak chest, containing an iron sword")
+
+    def test_describe_creature_carrying_modified_item(self):
+        goblin = Creature(self.game, name='goblin', description='A goblin', health=5, strength=20)
+        axe = Item(self.game, name='axe', description='A rusty axe', size=5)
+        axe.add_modifier('rusty')
+        goblin.add_item(axe)
+        self.assertEqual(goblin.describe().message, "A goblin, carrying a rusty axe")
+
+    def test_load_follows_add_and_remove(self):
+        sword = Item(self.game, name='sword', description='a sword', size=8)
+        lamp = Item(self.game, name='lamp', description='a lamp', size=5)
+        self.chest.add_item(sword)
+        self.chest.add_item(lamp)
+        self.assertEqual(self.chest.used_capacity(), 13)
+        self.assertEqual(self.chest.remaining_capacity(), 2)
+        self.chest.remove_item(sword)
+        self.assertEqual(self.chest.used_capacity(), 5)
+        self.assertEqual(self.chest.load, self.chest.recompute_used_capacity())
+
+    def test_size_change_reaches_holders(self):
+        pouch = Container(self.game, name='pouch', description='a pouch', size=4, capacity=10)
+        pouch.traits.closed = False
+        gem = Item(self.game, name='gem', description='a gem', size=1)
+        pouch.add_item(gem)
+        self.chest.add_item(pouch)
+        gem.size = 3
+        self.assertEqual(pouch.used_capacity(), 3)
+        pouch.size = 6
+        self.assertEqual(self.chest.used_capacity(), 6)
+        self.assertEqual(self.chest.load, self.chest.recompute_used_capacity())
+
+    def test_debug_capacity_detects_drift(self):
+        self.chest.add_item(Item(self.game, name='lamp', description='a lamp', size=5))
+        Container.DEBUG_CAPACITY = True
+        try:
+            self.assertEqual(self.chest.used_capacity(), 5)
+            self.chest.load += 1
+            self.assertRaises(AssertionError, self.chest.used_capacity)
+        finally:
+            Container.DEBUG_CAPACITY = False
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from location import Location
+from creature import Creature
+from result import Result
+from traits import Traits
+from game import Game
+
+
+class TestEventBus(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.events = self.game.events
+        self.player = self.game.player
+        self.rooms = dict((room.name, room) for room in self.game.vocabulary.get_objects_of_class(Location))
+
+    def test_player_subscribes_to_start_location(self):
+        self.assertTrue(self.events.has_subscribers(self.player.location))
+
+    def test_subscription_follows_player(self):
+        start = self.player.location
+        destination = self.rooms['Wood Paneled Room']
+        self.game.move_creature(self.player, start, destination)
+        self.assertFalse(self.events.has_subscribers(start))
+        self.assertTrue(self.events.has_subscribers(destination))
+
+    def test_unobserved_events_are_not_built(self):
+        built = []
+
+        def event(observer):
+            built.append(observer)
+            return Result("something happens")
+        self.events.publish(self.rooms['Roof'], event)
+        self.assertEqual(built, [])
+        self.events.publish(self.player.location, event)
+        self.assertEqual(built, [self.player])
+        self.assertEqual([n.message for n in self.player.take_notifications()], ["something happens"])
+        self.assertEqual(self.player.take_notifications(), [])
+
+    def test_creature_entry_notifies_observer(self):
+        cat = Creature(self.game, name='cat', traits=Traits(mobile=True), description='a cat',
+                       health=10, location=self.rooms['Wood Paneled Room'])
+        cat.movement_strategy = lambda g, location: self.player.location
+        cat.move(self.game, self.player)
+        notifications = self.player.take_notifications()
+        self.assertEqual(len(notifications), 1)
+        self.assertIn('has entered the room', notifications[0].message)
@@ -0,0 +1,77 @@
+from unittest import TestCase
+
+from route import Route
+from creature import Creature
+from game import Game
+
+
+class SilentRoute(Route):
+
+    def __init__(self):
+        super(SilentRoute, self).__init__(prompt=None)
+        self.output = []
+        self.input = ""
+
+    def send_output(self, message):
+        self.output.append(message)
+
+    def receive_input(self):
+        return self.input
+
+
+class TestRunCommands(TestCase):
+
+    def setUp(self):
+        self.route = SilentRoute()
+        self.game = Game(route=self.route)
+
+    def test_yields_turn_results(self):
+        turns = list(self.game.run_commands(['look', 'xyzzy', '', 'wait']))
+        self.assertEqual(len(turns), 3)
+        self.assertTrue(turns[0].success)
+        self.assertFalse(turns[1].success)
+        self.assertEqual([turn.turns for turn in turns], [1, 2, 3])
+        self.assertEqual(turns[2].message, "Time passes...")
+        self.assertEqual(self.route.output, [])
+
+    def test_quit_stops_without_exiting(self):
+        turns = list(self.game.run_commands(['quit', 'look']))
+        self.assertEqual(len(turns), 1)
+        self.assertTrue(turns[0].finished)
+        self.assertIn('You have a score of 0', turns[0].message)
+        self.assertEqual(self.game.turns, 0)
+
+    def test_death_finishes_game(self):
+        self.game.player.health = 0
+        turn = next(self.game.run_commands(['wait']))
+        self.assertTrue(turn.finished)
+        self.assertEqual(turn.events[-1], "You have died ... ")
+
+    def test_chained_commands(self):
+        turns = list(self.game.run_commands(['look. wait, then wait']))
+        self.assertEqual(len(turns), 3)
+        self.assertEqual(self.game.turns, 3)
+
+    def test_chain_stops_on_failure(self):
+        turns = list(self.game.run_commands(['wait then xyzzy then wait', 'wait']))
+        self.assertEqual([turn.success for turn in turns], [True, False, True])
+        self.assertEqual(self.game.turns, 3)
+
+    def test_line_sends_single_output(self):
+        self.route.input = 'wait then wait'
+        self.game.manage_turn()
+        self.assertEqual(len(self.route.output), 1)
+        self.assertEqual(self.route.output[0].count("Time passes..."), 2)
+        self.assertEqual(self.game.turns, 2)
+
+    def test_blank_line_sends_nothing(self):
+        self.route.input = '   '
+        self.game.manage_turn()
+        self.assertEqual(self.route.output, [])
+        self.assertEqual(self.game.turns, 0)
+
+    def test_neutral_result_continues_chain(self):
+        Creature(self.game, name='hermit', description='a hermit', health=10, location=self.game.player.location)
+        turns = list(self.game.run_commands(['greet hermit then wait']))
+        self.assertIsNone(turns[0].success)
+        self.assertEqual(len(turns), 2)
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from grammar import Grammar, Op, TokenClass, TOKEN_CLASSES
+from vocabulary import Tag
+
+
+class TestGrammar(TestCase):
+
+    def setUp(self):
+        self.with_indirect = Grammar(True)
+        self.without_indirect = Grammar(False)
+
+    def run_ops(self, grammar, tags):
+        row = 0
+        ops = []
+        for tag in tags:
+            row, op = grammar.step(row, tag)
+            ops.append(op)
+        return ops
+
+    def test_token_classes(self):
+        self.assertEqual(TOKEN_CLASSES[Tag.DETERMINER | Tag.NOUN], TokenClass.DETERMINER)
+        self.assertEqual(TOKEN_CLASSES[Tag.NOUN | Tag.ADJECTIVE], TokenClass.NOUN_OR_ADJECTIVE)
+        self.assertEqual(TOKEN_CLASSES[Tag.VERB], TokenClass.UNKNOWN)
+
+    def test_second_noun_becomes_indirect_object(self):
+        ops = self.run_ops(self.with_indirect, [Tag.NOUN, Tag.DETERMINER, Tag.NOUN])
+        self.assertEqual(ops, [Op.DIRECT_OBJECT, Op.NONE, Op.SHIFT_TO_INDIRECT])
+
+    def test_noun_as_modifier(self):
+        ops = self.run_ops(self.without_indirect, [Tag.NOUN | Tag.ADJECTIVE, Tag.NOUN])
+        self.assertEqual(ops, [Op.DIRECT_OBJECT, Op.MERGE_AS_MODIFIER])
+        ops = self.run_ops(self.without_indirect, [Tag.NOUN, Tag.NOUN])
+        self.assertEqual(ops, [Op.DIRECT_OBJECT, Op.DROP])
+
+    def test_prepositional_phrase(self):
+        ops = self.run_ops(self.with_indirect, [Tag.NOUN, Tag.PREPOSITION, Tag.ADJECTIVE, Tag.NOUN, Tag.NOUN])
+        self.assertEqual(ops, [Op.DIRECT_OBJECT, Op.PREPOSITION, Op.MODIFIER, Op.PREP_PHRASE,
+                               Op.SHIFT_TO_INDIRECT])
+
+    def test_repeated_function_words_fail(self):
+        self.assertEqual(self.run_ops(self.with_indirect, [Tag.DETERMINER, Tag.DETERMINER])[-1], Op.FAIL)
+        self.assertEqual(self.run_ops(self.with_indirect, [Tag.PREPOSITION, Tag.PREPOSITION])[-1], Op.FAIL)
+
+    def test_grammars_shared_between_actions(self):
+        class Stub:
+            indirect_object_role = None
+        self.assertIs(Grammar.for_action(Stub()), Grammar.for_action(Stub()))
@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from vocabulary import Tag
+from game import Game
+
+
+class TestLexer(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.lexer = self.game.lexer
+
+    def test_tokenize(self):
+        tokens = self.lexer.tokenize('unlock the golden lock with key')
+        self.assertEqual([t.word for t in tokens], ['unlock', 'the', 'golden', 'lock', 'with', 'key'])
+        self.assertTrue(tokens[0].tags & Tag.VERB)
+        self.assertTrue(tokens[1].tags & Tag.DETERMINER)
+        self.assertTrue(tokens[2].tags & Tag.ADJECTIVE)
+        self.assertTrue(tokens[3].tags & Tag.NOUN)
+        self.assertTrue(tokens[4].tags & Tag.PREPOSITION)
+
+    def test_noun_and_adjective(self):
+        tokens = self.lexer.tokenize('get apple core')
+        self.assertEqual(tokens[1].tags, Tag.NOUN | Tag.ADJECTIVE)
+
+    def test_unknown_word(self):
+        tokens = self.lexer.tokenize('get xyzzy')
+        self.assertEqual(tokens[1].tags, Tag.NONE)
+
+    def test_expands_abbreviations(self):
+        tokens = self.lexer.tokenize('inv')
+        self.assertEqual(tokens[0].word, 'inventory')
+
+    def test_tokenize_batch(self):
+        batches = list(self.lexer.tokenize_batch(['look', 'get key', '']))
+        self.assertEqual([len(tokens) for tokens in batches], [1, 2, 0])
+
+    def test_split_commands(self):
+        self.assertEqual(self.lexer.split_commands('get key. go north, then unlock door with key'),
+                         ['get key', 'go north', 'unlock door with key'])
+        self.assertEqual(self.lexer.split_commands('look at the heathen Then wait.'),
+                         ['look at the heathen', 'wait'])
+        self.assertEqual(self.lexer.split_commands(' , . '), [])
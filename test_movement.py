@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from location import Location
+from creature import Creature
+from movement import ChasePlayer, Flee, Patrol, SeekItem
+from traits import Traits
+from game import Game
+
+
+class TestMovement(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.rooms = dict((room.name, room) for room in self.game.vocabulary.get_objects_of_class(Location))
+        self.creature = Creature(self.game, name='cat', traits=Traits(mobile=True), description='a cat',
+                                 health=10, location=self.rooms['Crumbly Room'])
+
+    def step(self):
+        return self.creature.movement_strategy(self.game, self.creature.location)
+
+    def test_chase_player(self):
+        self.creature.movement_strategy = ChasePlayer(self.creature)
+        self.game.player.location = self.rooms['West Tower']
+        self.assertEqual(self.step(), self.rooms['Wood Paneled Room'])
+        self.assertEqual(self.step(), self.rooms['West Tower'])
+        self.assertEqual(self.step(), self.rooms['West Tower'])
+
+    def test_flee(self):
+        self.creature.movement_strategy = Flee(self.creature)
+        self.game.player.location = self.rooms['Crumbly Room']
+        self.creature.location.remove_item(self.creature)
+        self.rooms['Wood Paneled Room'].add_item(self.creature)
+        self.creature.location = self.rooms['Wood Paneled Room']
+        self.assertNotEqual(self.step(), self.rooms['Crumbly Room'])
+
+    def test_patrol(self):
+        route = [self.rooms['Crumbly Room'], self.rooms['North Tower']]
+        self.creature.movement_strategy = Patrol(self.creature, route)
+        visited = [self.step() for i in range(4)]
+        self.assertEqual(visited, [self.rooms['Wood Paneled Room'], self.rooms['North Tower'],
+                                   self.rooms['Wood Paneled Room'], self.rooms['Crumbly Room']])
+
+    def test_seek_item(self):
+        painting = self.game.vocabulary.lookup_noun_by_name('painting')[0]
+        self.creature.add_wanted_item(painting)
+        self.creature.movement_strategy = SeekItem(self.creature)
+        self.step()
+        self.assertEqual(self.step(), self.rooms['West Tower'])
+
+    def test_blocked_passage_recomputes_path(self):
+        graph = self.game.room_graph
+        east_tower = self.rooms['East Tower']
+        roof = self.rooms['Roof']
+        graph.refresh_conditions(self.game)
+        self.assertEqual(graph.distance(east_tower, roof), 1)
+        for passage in east_tower.exits.values():
+            if passage.destination == roof.id:
+                passage.condition = lambda g, p: False
+        self.assertTrue(graph.refresh_conditions(self.game))
+        self.assertIsNone(graph.distance(east_tower, roof))
+        self.assertFalse(graph.refresh_conditions(self.game))
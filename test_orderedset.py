@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from orderedset import OrderedSet
+
+
+class TestOrderedSet(TestCase):
+
+    def setUp(self):
+        self.items = OrderedSet([3, 1, 2])
+
+    def test_keeps_insertion_order(self):
+        self.items.add(0)
+        self.items.add(1)
+        self.assertEqual(list(self.items), [3, 1, 2, 0])
+        self.assertEqual(self.items.first(), 3)
+
+    def test_membership_and_removal(self):
+        self.assertTrue(1 in self.items)
+        self.items.remove(1)
+        self.assertFalse(1 in self.items)
+        self.assertEqual(len(self.items), 2)
+        self.assertRaises(KeyError, self.items.remove, 1)
+        self.items.discard(1)
+
+    def test_to_json(self):
+        self.assertEqual(self.items.to_json(), [3, 1, 2])
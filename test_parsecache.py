@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from command import Command
+from item import Item
+from schema import Role
+from game import Game
+
+
+class TestParseCache(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.player = self.game.player
+        self.cache = self.game.parse_cache
+        self.coin = Item(self.game, name='coin', description='a gold coin', size=1)
+        self.player.location.add_item(self.coin)
+
+    def resolve(self, input_text):
+        command = Command(self.game)
+        return command, command.resolve(input_text)
+
+    def test_repeated_input_hits_cache(self):
+        first, result = self.resolve('get coin')
+        self.assertTrue(result.success)
+        second, result = self.resolve('get   coin')
+        self.assertTrue(result.success)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertIs(second.action, first.action)
+        self.assertIs(second.schema[Role.THEME], self.coin)
+        self.assertIsNot(second.schema, first.schema)
+
+    def test_context_change_invalidates(self):
+        self.resolve('get coin')
+        self.player.location.remove_item(self.coin)
+        command, result = self.resolve('get coin')
+        self.assertFalse(result.success)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_vocabulary_change_invalidates(self):
+        command, result = self.resolve('get token')
+        self.assertFalse(result.success)
+        self.coin.add_alias('token')
+        command, result = self.resolve('get token')
+        self.assertTrue(result.success)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_least_recently_used_evicted(self):
+        self.cache.max_entries = 2
+        self.resolve('look')
+        self.resolve('get coin')
+        self.resolve('look')
+        self.resolve('inventory')
+        self.assertEqual(len(self.cache), 2)
+        self.assertIn('look', self.cache.entries)
+        self.assertNotIn('get coin', self.cache.entries)
@@ -3,6 +3,8 @@ from player import Player
 from item import Item
 from direction import Direction
 from location import Location
+from container import Container
+from creature import Creature
 from game import Game
 
 
@@ -86,3 +88,47 @@ class TestPlayer(TestCase):
         r = self.player.list_inventory()
         self.assertEqual(str(r), "You are carrying:\n\tThe family television")
 
+
+
+class TestPlayerHolders(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.player = self.game.player
+        self.room = self.player.location
+        self.box = Container(self.game, name='box', description='a box', size=10, capacity=10)
+        self.box.traits.closed = False
+        self.pouch = Container(self.game, name='pouch', description='a pouch', size=2, capacity=2)
+        self.pouch.traits.closed = False
+        self.gem = Item(self.game, name='gem', description='a gem', size=1)
+        self.goblin = Creature(self.game, name='goblin', description='a goblin',
+                               health=5, strength=10, location=self.room)
+        self.room.add_item(self.box)
+        self.box.add_item(self.pouch)
+
+    def test_item_in_nested_containers(self):
+        self.box.add_item(self.gem)
+        self.assertIs(self.player.nearby_container_having(self.gem), self.box)
+        self.box.remove_item(self.gem)
+        self.pouch.add_item(self.gem)
+        self.assertIs(self.player.nearby_container_having(self.gem), self.pouch)
+        self.assertIsNone(self.player.nearby_creature_having(self.gem))
+        self.box.traits.closed = True
+        self.assertIsNone(self.player.nearby_container_having(self.gem))
+
+    def test_item_moved_to_creature(self):
+        self.pouch.add_item(self.gem)
+        self.pouch.remove_item(self.gem)
+        self.assertIsNone(self.player.nearby_container_having(self.gem))
+        self.goblin.add_item(self.gem)
+        self.assertIsNone(self.player.nearby_container_having(self.gem))
+        self.assertIs(self.player.nearby_creature_having(self.gem), self.goblin)
+
+    def test_container_carried_by_creature(self):
+        self.pouch.add_item(self.gem)
+        self.box.remove_item(self.pouch)
+        self.goblin.add_item(self.pouch)
+        self.assertIs(self.player.nearby_creature_having(self.gem), self.goblin)
+        elsewhere = next(p for p in self.room.exits.values()).destination
+        self.game.move_creature(self.goblin, self.room, self.game.vocabulary.lookup_noun(elsewhere))
+        self.assertIsNone(self.player.nearby_creature_having(self.gem))
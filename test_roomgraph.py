@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+import direction
+from location import Location
+from item import Item
+from game import Game
+
+
+class TestRoomGraph(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.graph = self.game.room_graph
+        self.rooms = dict((room.name, room) for room in self.game.vocabulary.get_objects_of_class(Location))
+
+    def test_distance(self):
+        crumbly_room = self.rooms['Crumbly Room']
+        self.assertEqual(self.graph.distance(crumbly_room, crumbly_room), 0)
+        self.assertEqual(self.graph.distance(crumbly_room, self.rooms['North Tower']), 2)
+        self.assertEqual(self.graph.distance(self.rooms['Wood Paneled Room'], self.rooms['street']), 8)
+        self.assertIsNone(self.graph.distance(self.rooms['street'], crumbly_room))
+
+    def test_conditional_passages(self):
+        east_tower = self.rooms['East Tower']
+        roof = self.rooms['Roof']
+        self.assertEqual(self.graph.distance(east_tower, roof), 1)
+        self.assertIsNone(self.graph.distance(east_tower, roof, include_conditional=False))
+
+    def test_path(self):
+        path = self.graph.path(self.rooms['Crumbly Room'], self.rooms['West Tower'])
+        self.assertEqual([p.name for p in path], ['Crumbly Room-north', 'Wood Paneled Room-west'])
+        self.assertEqual(self.graph.next_passage(self.rooms['Crumbly Room'], self.rooms['West Tower']), path[0])
+
+    def test_add_exit_updates_graph(self):
+        crumbly_room = self.rooms['Crumbly Room']
+        cellar = Location(self.game, 'Cellar', description='A damp cellar')
+        self.assertIsNone(self.graph.distance(crumbly_room, cellar))
+        crumbly_room.add_exit(direction.down, cellar)
+        self.assertEqual(self.graph.distance(crumbly_room, cellar), 1)
+        self.assertTrue(cellar.id in self.graph.neighbours(crumbly_room))
+
+    def test_set_destination_updates_graph(self):
+        crumbly_room = self.rooms['Crumbly Room']
+        street = self.rooms['street']
+        self.assertEqual(self.graph.distance(crumbly_room, street), 9)
+        passage = crumbly_room.exits[direction.north.id]
+        passage.set_destination(street)
+        self.assertEqual(self.graph.distance(crumbly_room, street), 1)
+        self.assertEqual(self.graph.next_passage(crumbly_room, street), passage)
+
+    def test_add_exit_keeps_unaffected_trees(self):
+        crumbly_room = self.rooms['Crumbly Room']
+        west_tower = self.rooms['West Tower']
+        self.graph.distance(crumbly_room, west_tower)
+        self.graph.distance(crumbly_room, crumbly_room)
+        cellar = Location(self.game, 'Cellar', description='A damp cellar')
+        cellar.add_exit(direction.up, crumbly_room)
+        self.assertEqual(self.graph.distance(cellar, west_tower), 3)
+        self.assertEqual(len(self.graph.trees), 1)
+        self.assertEqual([p.name for p in self.graph.path(crumbly_room, west_tower)],
+                         ['Crumbly Room-north', 'Wood Paneled Room-west'])
+
+    def test_refresh_only_evaluates_changed_conditions(self):
+        east_tower = self.rooms['East Tower']
+        roof = self.rooms['Roof']
+        passage = next(p for p in east_tower.exits.values() if p.destination == roof.id)
+        condition = passage.condition
+        self.graph.refresh_conditions(self.game)
+        calls = condition.hits + condition.misses
+        self.assertFalse(self.graph.refresh_conditions(self.game))
+        self.assertEqual(condition.hits + condition.misses, calls)
+        anvil = Item(self.game, name='anvil', description='An anvil', size=30)
+        self.game.player.inventory.add_item(anvil, force=True)
+        self.assertTrue(self.graph.refresh_conditions(self.game))
+        self.assertIsNone(self.graph.distance(east_tower, roof))
+        self.game.player.inventory.remove_item(anvil)
+        self.assertTrue(self.graph.refresh_conditions(self.game))
+        self.assertEqual(self.graph.distance(east_tower, roof), 1)
+
+    def test_condition_assigned_to_free_passage(self):
+        crumbly_room = self.rooms['Crumbly Room']
+        passage = crumbly_room.exits[direction.north.id]
+        self.assertFalse(passage.conditional)
+        self.graph.refresh_conditions(self.game)
+        self.assertEqual(self.graph.distance(crumbly_room, self.rooms['West Tower']), 2)
+        passage.condition = lambda g, p: False
+        self.assertTrue(passage.conditional)
+        self.graph.refresh_conditions(self.game)
+        self.assertNotIn(passage, self.graph.open_exits(crumbly_room))
+        self.assertIsNone(self.graph.distance(crumbly_room, self.rooms['West Tower']))
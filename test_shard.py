@@ -0,0 +1,115 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import direction
+from location import Location
+from creature import Creature
+from item import Item
+from movement import Patrol
+from route import Route
+from shard import partition_regions
+from traits import Traits
+from game import Game
+
+
+class TestShard(TestCase):
+
+    def setUp(self):
+        self.game = Game(route=Route(prompt=None))
+        self.rooms = dict((room.name, room) for room in self.game.vocabulary.get_objects_of_class(Location))
+
+    def tearDown(self):
+        self.game.disable_sharding()
+
+    def test_partition_regions(self):
+        region_of = partition_regions(self.game.room_graph, 3)
+        self.assertEqual(set(region_of.keys()), set(self.game.room_graph.location_ids))
+        self.assertEqual(set(region_of.values()), {0, 1, 2})
+
+    def patrolling_cat(self):
+        garden = self.rooms['garden']
+        patio = self.rooms['patio']
+        cat = Creature(self.game, name='cat', traits=Traits(mobile=True), description='a cat',
+                       health=10, location=garden)
+        cat.movement_strategy = Patrol(cat, [garden, patio])
+        return cat, garden, patio
+
+    def test_remote_moves_reach_main_process(self):
+        cat, garden, patio = self.patrolling_cat()
+        self.game.enable_sharding(2)
+        shards = self.game.shards
+        self.assertNotEqual(shards.region_of[garden.id], shards.region_of[self.game.player.location.id])
+        self.game.update_game()
+        self.assertEqual(cat.location, patio)
+        self.assertIn(cat.id, patio.items)
+        self.game.update_game()
+        self.assertEqual(cat.location, garden)
+
+    def test_player_region_simulated_locally(self):
+        self.game.enable_sharding(2)
+        shards = self.game.shards
+        self.game.update_game()
+        player_region = shards.region_of[self.game.player.location.id]
+        for c in shards.local_creatures():
+            self.assertEqual(shards.region_of[c.location.id], player_region)
+
+    def test_trait_changes_reach_workers(self):
+        cat, garden, patio = self.patrolling_cat()
+        self.game.enable_sharding(2)
+        cat.traits.mobile = False
+        self.game.update_game()
+        self.assertEqual(cat.location, garden)
+
+    def test_main_process_moves_reach_workers(self):
+        cat, garden, patio = self.patrolling_cat()
+        self.game.enable_sharding(2)
+        self.game.move_creature(cat, garden, patio)
+        self.game.update_game()
+        self.assertEqual(cat.location, garden)
+        self.assertIn(cat.id, garden.items)
+        self.assertNotIn(cat.id, patio.items)
+
+    def test_new_rooms_repartition_workers(self):
+        self.game.enable_sharding(2)
+        shed = Location(self.game, 'shed', description='a garden shed')
+        self.rooms['garden'].add_exit(direction.west, shed)
+        self.game.update_game()
+        self.assertIn(shed.id, self.game.shards.region_of)
+
+    def test_without_fork_simulates_in_process(self):
+        cat, garden, patio = self.patrolling_cat()
+        with patch('shard.get_all_start_methods', return_value=['spawn']):
+            self.game.enable_sharding(2)
+        self.assertEqual(self.game.shards.processes, {})
+        self.game.update_game()
+        self.assertEqual(cat.location, patio)
+
+    def test_crashed_worker_is_simulated_in_process(self):
+        cat, garden, patio = self.patrolling_cat()
+        self.game.enable_sharding(2)
+        shards = self.game.shards
+        region = shards.region_of[garden.id]
+        shards.processes[region].terminate()
+        shards.processes[region].join()
+        self.game.update_game()
+        self.assertNotIn(region, shards.processes)
+        self.assertEqual(cat.location, patio)
+        self.game.update_game()
+        self.assertEqual(cat.location, garden)
+
+    def test_new_things_refork_only_their_region(self):
+        garden = self.rooms['garden']
+        self.game.enable_sharding(2)
+        shards = self.game.shards
+        processes = dict(shards.processes)
+        self.game.player.location.add_item(Item(self.game, name='pebble', description='a pebble'))
+        Item(self.game, name='leaf', description='a leaf').add_modifier('crinkly')
+        self.game.update_game()
+        self.assertEqual(shards.processes, processes)
+        garden.add_item(Item(self.game, name='acorn', description='an acorn'))
+        self.game.update_game()
+        region = shards.region_of[garden.id]
+        self.assertIsNot(shards.processes[region], processes[region])
+        for other, process in processes.items():
+            if other != region:
+                self.assertIs(shards.processes[other], process)
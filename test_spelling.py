@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+from spelling import SpellingIndex, SpellingOverlay, edit_distance
+
+
+class TestSpellingIndex(TestCase):
+
+    def setUp(self):
+        self.index = SpellingIndex()
+        for word in ['table', 'sword', 'look', 'lock', 'apple']:
+            self.index.add(word)
+
+    def test_edit_distance(self):
+        self.assertEqual(edit_distance('table', 'table'), 0)
+        self.assertEqual(edit_distance('tabel', 'table'), 1)
+        self.assertEqual(edit_distance('swrd', 'sword'), 1)
+        self.assertEqual(edit_distance('kitten', 'sitting'), 3)
+
+    def test_suggest(self):
+        self.assertEqual(self.index.suggest('tabel'), ['table'])
+        self.assertEqual(self.index.suggest('swordd'), ['sword'])
+        self.assertEqual(self.index.suggest('aple'), ['apple'])
+        self.assertEqual(self.index.suggest('zzzzz'), [])
+
+    def test_suggest_ambiguous(self):
+        self.assertEqual(self.index.suggest('lok'), ['lock', 'look'])
+
+    def test_remove(self):
+        self.assertTrue(self.index.remove('lock'))
+        self.assertEqual(self.index.suggest('lok'), ['look'])
+        self.assertFalse('lock' in self.index)
+
+    def test_overlay_leaves_base_untouched(self):
+        overlay = SpellingOverlay(self.index)
+        self.assertTrue(overlay.remove('lock'))
+        self.assertTrue(overlay.add('lack'))
+        self.assertEqual(overlay.suggest('lok'), ['look'])
+        self.assertEqual(overlay.suggest('lacck'), ['lack'])
+        self.assertEqual(self.index.suggest('lok'), ['lock', 'look'])
+        self.assertFalse('lack' in self.index)
@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from trie import PrefixTrie, TrieOverlay
+
+
+class TestPrefixTrie(TestCase):
+
+    def setUp(self):
+        self.trie = PrefixTrie()
+        for word in ['inventory', 'in', 'into', 'sword', 'swim', 'sunflower']:
+            self.trie.add(word)
+
+    def test_contains(self):
+        self.assertTrue('sword' in self.trie)
+        self.assertFalse('swo' in self.trie)
+        self.assertEqual(len(self.trie), 6)
+
+    def test_unique_completion(self):
+        self.assertEqual(self.trie.unique_completion('inv'), 'inventory')
+        self.assertEqual(self.trie.unique_completion('swo'), 'sword')
+        self.assertIsNone(self.trie.unique_completion('sw'))
+        self.assertIsNone(self.trie.unique_completion('xyz'))
+
+    def test_complete_ranks_shortest_first(self):
+        self.assertEqual(self.trie.complete('in'), ['in', 'into', 'inventory'])
+        self.assertEqual(self.trie.complete('s', limit=2), ['swim', 'sword'])
+
+    def test_remove(self):
+        self.assertTrue(self.trie.remove('swim'))
+        self.assertFalse(self.trie.remove('swim'))
+        self.assertEqual(self.trie.unique_completion('sw'), 'sword')
+        self.assertEqual(self.trie.complete('s'), ['sword', 'sunflower'])
+
+    def test_completions_limited(self):
+        for i in range(PrefixTrie.MAX_COMPLETIONS * 2):
+            self.trie.add('coin{}'.format(i))
+        self.assertEqual(len(self.trie.complete('coin')), PrefixTrie.MAX_COMPLETIONS)
+        self.assertEqual(self.trie.complete('coin')[0], 'coin0')
+
+    def test_overlay_leaves_base_untouched(self):
+        overlay = TrieOverlay(self.trie)
+        self.assertTrue(overlay.remove('swim'))
+        self.assertTrue(overlay.add('swan'))
+        self.assertFalse(overlay.add('sword'))
+        self.assertEqual(overlay.complete('sw'), ['swan', 'sword'])
+        self.assertEqual(overlay.unique_completion('swo'), 'sword')
+        self.assertIsNone(overlay.unique_completion('swi'))
+        self.assertEqual(len(overlay), 6)
+        self.assertTrue('swim' in self.trie)
+        self.assertFalse('swan' in self.trie)
+        self.assertTrue(overlay.add('swim'))
+        self.assertEqual(overlay.complete('swi'), ['swim'])
+
+    def test_overlay_removal_beyond_stored_completions(self):
+        for i in range(PrefixTrie.MAX_COMPLETIONS + 2):
+            self.trie.add('coin{}'.format(i))
+        overlay = TrieOverlay(self.trie)
+        overlay.remove('coin0')
+        completions = overlay.complete('coin')
+        self.assertEqual(len(completions), PrefixTrie.MAX_COMPLETIONS)
+        self.assertNotIn('coin0', completions)
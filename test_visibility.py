@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from schema import Scope
+from traits import Traits
+from item import Item
+from container import Container
+from game import Game
+
+
+class TestVisibilityCache(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.player = self.game.player
+        self.visibility = self.player.visibility
+        self.box = Container(self.game, name='box', description='a cardboard box', capacity=10)
+        self.coin = Item(self.game, name='coin', description='a gold coin', size=1)
+        self.box.add_item(self.coin, force=True)
+        self.player.location.add_item(self.box)
+
+    def test_closed_container_hides_contents(self):
+        self.assertTrue(self.box.id in self.visibility.reachable(Scope.PROXIMITY))
+        self.assertFalse(self.coin.id in self.visibility.reachable(Scope.NEARBY))
+
+    def test_opening_container_invalidates(self):
+        self.visibility.reachable(Scope.NEARBY)
+        self.box.traits.closed = False
+        self.assertTrue(self.coin.id in self.visibility.reachable(Scope.NEARBY))
+        self.assertTrue(self.coin.id in self.visibility.reachable(Scope.EXTERNAL))
+        self.assertFalse(self.coin.id in self.visibility.reachable(Scope.PROXIMITY))
+
+    def test_cache_hits(self):
+        self.visibility.reachable(Scope.NEARBY)
+        misses = self.visibility.misses
+        self.visibility.reachable(Scope.INVENTORY)
+        self.assertEqual(self.visibility.misses, misses)
+        self.assertGreater(self.visibility.hit_rate(), 0)
+
+    def test_taking_item_invalidates(self):
+        self.box.traits.closed = False
+        self.player.get(self.coin)
+        self.assertTrue(self.coin.id in self.visibility.reachable(Scope.INVENTORY))
+
+    def test_nested_containers(self):
+        pouch = Container(self.game, name='pouch', description='a leather pouch', capacity=5)
+        gem = Item(self.game, name='gem', description='a tiny gem', size=1)
+        pouch.add_item(gem, force=True)
+        self.box.add_item(pouch, force=True)
+        self.box.traits.closed = False
+        self.assertTrue(pouch.id in self.visibility.reachable(Scope.NEARBY))
+        self.assertFalse(gem.id in self.visibility.reachable(Scope.NEARBY))
+        pouch.traits.closed = False
+        self.assertTrue(gem.id in self.visibility.reachable(Scope.NEARBY))
+        self.assertEqual(self.player.nearby_container_having(gem), pouch)
+        self.box.traits.closed = True
+        self.assertFalse(gem.id in self.visibility.reachable(Scope.NEARBY))
+        self.assertIsNone(self.player.nearby_container_having(gem))
+
+    def test_unchanged_branch_is_reused(self):
+        pouch = Container(self.game, name='pouch', description='a leather pouch', capacity=5)
+        self.box.add_item(pouch, force=True)
+        self.box.traits.closed = False
+        self.visibility.reachable(Scope.NEARBY)
+        box_version = self.box.version
+        self.player.location.add_item(Item(self.game, name='pebble', description='a pebble'))
+        self.visibility.reachable(Scope.NEARBY)
+        self.assertEqual(self.box.version, box_version)
+        self.assertEqual(self.box.reachable_version, box_version)
+
+    def test_get_from_nested_container(self):
+        pouch = Container(self.game, name='pouch', description='a leather pouch', capacity=5,
+                          traits=Traits(closed=False))
+        gem = Item(self.game, name='gem', description='a tiny gem', size=1)
+        pouch.add_item(gem)
+        self.box.add_item(pouch, force=True)
+        self.box.traits.closed = False
+        r = self.player.get(gem)
+        self.assertTrue(r.success)
+        self.assertTrue(self.player.in_inventory(gem))
+
+    def test_scopes_computed_on_demand(self):
+        self.visibility.reachable(Scope.INVENTORY)
+        stamp, scopes = self.visibility.entries[self.player.location.id]
+        self.assertEqual(set(scopes.keys()), {Scope.INVENTORY})
+        self.visibility.reachable(Scope.PROXIMITY)
+        self.assertNotIn(Scope.NEARBY, scopes)
@@ -0,0 +1,209 @@
+from unittest import TestCase
+
+from vocabulary import Vocabulary, PartOfSpeech
+from item import Item
+from creature import Creature
+from game import Game
+
+
+class TestVocabulary(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.vocabulary = self.game.vocabulary
+        self.lamp = Item(self.game, name='lamp', description='a shiny brass lamp', aliases=['lantern'])
+
+    def test_lookup_by_name(self):
+        self.assertEqual(self.vocabulary.lookup_noun_by_name('lamp'), [self.lamp])
+        self.assertEqual(self.vocabulary.lookup_noun_by_name('lantern'), [self.lamp])
+        self.assertEqual(self.vocabulary.lookup_noun_by_name('torch'), [])
+
+    def test_lookup_by_name_multiple(self):
+        other_lamp = Item(self.game, name='lamp', description='a dim oil lamp')
+        self.assertEqual(self.vocabulary.lookup_noun_by_name('lamp'), [self.lamp, other_lamp])
+
+    def test_add_alias(self):
+        self.assertFalse(self.vocabulary.is_noun('torch'))
+        self.lamp.add_alias('torch')
+        self.assertTrue(self.vocabulary.is_noun('torch'))
+        self.assertEqual(self.vocabulary.lookup_noun_by_name('torch'), [self.lamp])
+
+    def test_add_verb_alias(self):
+        look = self.vocabulary.lookup_verb_by_name('look')
+        look.add_alias('examine')
+        self.assertEqual(self.vocabulary.lookup_verb_by_name('examine'), look)
+
+    def test_unregister(self):
+        self.vocabulary.unregister_noun(self.lamp)
+        self.assertFalse(self.vocabulary.is_noun('lamp'))
+        self.assertFalse(self.vocabulary.is_valid_part_of_speech(PartOfSpeech.NOUN, 'lantern'))
+
+    def test_get_objects_of_class(self):
+        creatures = self.vocabulary.get_objects_of_class(Creature)
+        self.assertTrue(self.game.player in creatures)
+        self.assertTrue(all(isinstance(c, Creature) for c in creatures))
+        self.assertTrue(self.lamp in self.vocabulary.get_objects_of_class(Item))
+        self.assertFalse(self.lamp in creatures)
+
+    def test_get_objects_of_class_after_unregister(self):
+        self.vocabulary.unregister_noun(self.lamp)
+        self.assertFalse(self.lamp in self.vocabulary.get_objects_of_class(Item))
+
+    def test_lookup_by_id(self):
+        self.assertEqual(self.vocabulary.lookup_noun(self.lamp.id), self.lamp)
+        self.assertRaises(KeyError, self.vocabulary.lookup_adjective, self.lamp.id)
+
+    def test_lookup_by_legacy_string_id(self):
+        legacy_id = self.vocabulary.format_id(self.lamp.id)
+        self.assertEqual(len(legacy_id), 6)
+        self.assertEqual(self.vocabulary.lookup_noun(legacy_id), self.lamp)
+        self.assertEqual(self.vocabulary.parse_id(legacy_id), self.lamp.id)
+
+    def test_legacy_string_ids_at_every_entry_point(self):
+        vocabulary = self.vocabulary
+        look = vocabulary.lookup_verb_by_name('look')
+        self.assertIs(vocabulary.lookup_verb(vocabulary.format_id(look.id)), look)
+        legacy_id = vocabulary.format_id(self.lamp.id)
+        vocabulary.add_noun_alias(legacy_id, 'torch')
+        self.assertEqual(vocabulary.lookup_noun_by_name('torch'), [self.lamp])
+        vocabulary.unindex_classes(self.lamp, legacy_id)
+        self.assertFalse(self.lamp in vocabulary.get_objects_of_class(Item))
+        vocabulary.unindex_name(PartOfSpeech.NOUN, 'torch', legacy_id)
+        self.assertEqual(vocabulary.lookup_noun_by_name('torch'), [])
+        vocabulary.unregister(PartOfSpeech.NOUN, legacy_id)
+        self.assertFalse(vocabulary.is_noun('lamp'))
+
+    def test_adjectives_are_interned(self):
+        other_lamp = Item(self.game, name='lamp', description='a dim oil lamp')
+        self.lamp.add_modifier('brass')
+        other_lamp.add_modifier('brass')
+        self.assertEqual(self.lamp.modifiers, other_lamp.modifiers)
+        self.assertEqual(len(self.vocabulary.lookup_adjective_by_name('brass')), 1)
+
+    def test_lookup_by_modifiers(self):
+        keys = dict((k.full_name(), k) for k in self.vocabulary.lookup_noun_by_name('key'))
+        golden_key = keys['golden key']
+        bronze_key = keys['bronze key']
+        self.assertEqual(self.vocabulary.lookup_by_modifiers('key', {'golden'}), [golden_key])
+        self.assertEqual(self.vocabulary.lookup_by_modifiers('key', {'bronze'}), [bronze_key])
+        self.assertEqual(self.vocabulary.lookup_by_modifiers('key', {'golden', 'bronze'}), [])
+        self.assertEqual(self.vocabulary.lookup_by_modifiers('key', {'purple'}), [])
+
+    def test_lookup_by_modifiers_with_alias(self):
+        self.lamp.add_modifier('brass')
+        self.lamp.add_alias('torch')
+        self.assertEqual(self.vocabulary.lookup_by_modifiers('torch', {'brass'}), [self.lamp])
+        self.assertEqual(self.lamp.modifier_names, {'brass'})
+
+    def test_expand_prefix(self):
+        self.assertEqual(self.vocabulary.expand_prefix(PartOfSpeech.VERB, 'inv'), 'inventory')
+        self.assertEqual(self.vocabulary.expand_prefix(PartOfSpeech.NOUN, 'lant'), 'lantern')
+        self.assertIsNone(self.vocabulary.expand_prefix(PartOfSpeech.NOUN, 'la'))
+        self.assertEqual(self.vocabulary.complete('lam'), ['lamp'])
+
+    def test_frozen_lookups(self):
+        self.assertIsNotNone(self.vocabulary.frozen)
+        self.assertTrue(self.vocabulary.is_verb('look'))
+        self.assertEqual(self.vocabulary.lookup_noun_by_name('lamp'), [self.lamp])
+        self.assertEqual(len(self.vocabulary.lookup_noun_by_name('key')), 4)
+
+    def test_frozen_lexicon_is_shared(self):
+        other_game = Game(lexicon=self.game.lexicon)
+        self.assertIs(other_game.lexicon, self.game.lexicon)
+        self.assertEqual(len(other_game.vocabulary.lookup_noun_by_name('key')), 4)
+        self.assertIsNot(other_game.vocabulary.lookup_noun_by_name('key')[0],
+                         self.vocabulary.lookup_noun_by_name('key')[0])
+
+    def test_adopted_lexicon_tables_are_not_rebuilt(self):
+        lexicon = self.game.lexicon
+        other_vocabulary = Game(lexicon=lexicon).vocabulary
+        self.assertIs(other_vocabulary.names[PartOfSpeech.NOUN], lexicon.names[PartOfSpeech.NOUN])
+        self.assertIs(other_vocabulary.prefixes[PartOfSpeech.VERB], lexicon.prefixes[PartOfSpeech.VERB])
+
+    def test_shared_lexicon_copied_on_write(self):
+        other_vocabulary = Game(lexicon=self.game.lexicon).vocabulary
+        other_vocabulary.unregister_noun(other_vocabulary.lookup_noun_by_name('apple')[0])
+        self.assertFalse(other_vocabulary.is_noun('apple'))
+        self.assertTrue(self.vocabulary.is_noun('apple'))
+        self.assertEqual(self.vocabulary.complete('appl', {PartOfSpeech.NOUN}), ['apple'])
+        self.assertEqual(other_vocabulary.complete('appl', {PartOfSpeech.NOUN}), [])
+        self.assertIs(other_vocabulary.prefixes[PartOfSpeech.NOUN].base,
+                      self.game.lexicon.prefixes[PartOfSpeech.NOUN])
+
+    def test_frozen_alias_with_existing_name(self):
+        apple = self.vocabulary.lookup_noun_by_name('apple')[0]
+        apple.add_alias('apple')
+        self.assertEqual(self.vocabulary.lookup_noun_by_name('apple'), [apple])
+
+    def test_unregister_frozen_entry(self):
+        apple = self.vocabulary.lookup_noun_by_name('apple')[0]
+        self.vocabulary.unregister_noun(apple)
+        self.assertFalse(self.vocabulary.is_noun('apple'))
+        self.assertEqual(self.vocabulary.complete('appl', {PartOfSpeech.NOUN}), [])
+
+    def test_destroy_creature(self):
+        villager = self.vocabulary.lookup_noun_by_name('villager')[0]
+        room = villager.holder
+        self.assertTrue(villager.id in room.items)
+        villager.destroy()
+        self.assertFalse(villager.id in room.items)
+        self.assertIsNone(villager.holder)
+        self.assertFalse(villager in self.vocabulary.get_objects_of_class(Creature))
+        self.assertFalse(villager in self.vocabulary.get_objects())
+        self.assertRaises(KeyError, self.vocabulary.lookup_noun, villager.inventory.id)
+
+    def test_compaction(self):
+        class Coin(Item):
+            pass
+        noun_count = self.vocabulary.count(PartOfSpeech.NOUN)
+        entry_count = len(self.vocabulary.entries)
+        coins = [Coin(self.game, name='coin', description='a coin') for i in range(Vocabulary.MIN_COMPACTION_SIZE * 4)]
+        for coin in coins:
+            coin.destroy()
+        self.assertEqual(len(self.vocabulary.entries), entry_count)
+        self.assertEqual(len(self.vocabulary.parts_of_speech), entry_count)
+        self.assertFalse(Coin in self.vocabulary.classes)
+        self.assertEqual(self.vocabulary.count(PartOfSpeech.NOUN), noun_count)
+        self.assertLess(len(self.vocabulary.catalogs[PartOfSpeech.NOUN]), noun_count + len(coins))
+        self.assertFalse(self.vocabulary.is_noun('coin'))
+
+
+class Word:
+
+    def __init__(self, name, aliases=()):
+        self.name = name
+        self.aliases = list(aliases)
+
+
+class TestLexiconSignature(TestCase):
+
+    def setUp(self):
+        vocabulary = Vocabulary()
+        for name in ['red', 'blue']:
+            vocabulary.register_adjective(Word(name))
+        self.lexicon = vocabulary.freeze()
+
+    def test_same_world_adopts_lexicon(self):
+        vocabulary = Vocabulary()
+        vocabulary.adopt(self.lexicon)
+        for name in ['red', 'blue']:
+            vocabulary.register_adjective(Word(name))
+        self.assertIs(vocabulary.freeze(), self.lexicon)
+
+    def test_different_world_rebuilds_lexicon(self):
+        vocabulary = Vocabulary()
+        vocabulary.adopt(self.lexicon)
+        for name in ['red', 'green']:
+            vocabulary.register_adjective(Word(name))
+        self.assertTrue(vocabulary.is_adjective('green'))
+        self.assertFalse(vocabulary.is_adjective('blue'))
+        self.assertIsNot(vocabulary.freeze(), self.lexicon)
+
+    def test_different_aliases_rebuild_lexicon(self):
+        vocabulary = Vocabulary()
+        vocabulary.adopt(self.lexicon)
+        vocabulary.register_adjective(Word('red'))
+        vocabulary.register_adjective(Word('blue', aliases=['azure']))
+        lexicon = vocabulary.freeze()
+        self.assertIsNot(lexicon, self.lexicon)
+        self.assertTrue(vocabulary.is_adjective('azure'))
@@ -12,14 +12,19 @@ class Thing:
 
         self.game = game
         self.vocabulary = game.vocabulary
-        self.id = self.vocabulary.register_noun(self)
         self.name = name
         if aliases:
             self.aliases = aliases
         else:
             self.aliases = []
+        self.id = self.vocabulary.register_noun(self)
         self.traits = Traits.merge(self, traits, Thing.DEFAULT_TRAITS)
+        self.traits.watch(self.trait_changed)
         self.modifiers = set()
+        self.modifier_names = set()
+        self.holder = None
+        self.version = 0
+        self.watchers = []
         self.valid_roles = {
             Role.AGENT: [],
             Role.PATIENT: [],
@@ -37,8 +42,12 @@ class Thing:
         return full_name
 
     def add_modifier(self, adjective):
-        modifier_id = self.vocabulary.register_adjective(Modifier(self.game, name=adjective))
-        self.modifiers.add(modifier_id)
+        modifier = Modifier.intern(self.game, adjective)
+        self.modifiers.add(modifier.id)
+        self.modifier_names.add(adjective)
+        self.vocabulary.index_modifier(self.name, adjective, self)
+        for alias in self.aliases:
+            self.vocabulary.index_modifier(alias, adjective, self)
 
     def article(self):
         if self.traits.composite:
@@ -46,7 +55,7 @@ class Thing:
         else:
             first_word = self.name
             if len(self.modifiers) > 0:
-                first_word = list(self.modifiers)[0]
+                first_word = self.vocabulary.lookup_adjective(list(self.modifiers)[0]).name
             if first_word[0] in ['a', 'e', 'i', 'o', 'u']:
                 article = 'an'
             else:
@@ -63,8 +72,47 @@ class Thing:
     def to_json(self):
         return vars(self)
 
+    def parent(self):
+        return self.holder
+
+    def touch(self):
+        journal = self.game.journal
+        thing = self
+        while thing is not None:
+            thing.version += 1
+            if journal is not None:
+                journal.add(thing.id)
+            thing = thing.parent()
+
+    def record_change(self):
+        journal = self.game.journal
+        if journal is not None:
+            journal.add(self.id)
+
+    def exposed_ids(self):
+        return frozenset()
+
+    def watch(self, watcher):
+        self.watchers.append(watcher)
+
+    def notify_watchers(self, key):
+        for watcher in self.watchers:
+            watcher(self, key)
+
+    def trait_changed(self, key):
+        self.touch()
+        self.notify_watchers(key)
+
+    def destroy(self):
+        if self.holder is not None:
+            self.holder.remove_item(self, force=True)
+        self.vocabulary.unregister_noun(self)
+
     def add_alias(self, alias):
         self.aliases.append(alias)
+        self.vocabulary.add_noun_alias(self.id, alias)
+        for adjective in self.modifier_names:
+            self.vocabulary.index_modifier(alias, adjective, self)
 
     def add_role(self, role, verb):
         self.valid_roles[role].append(self.vocabulary.lookup_verb_by_name(verb))
@@ -5,9 +5,19 @@ class Traits:
                     'fragile', 'hostile', 'friendly', 'mobile', 'precarious'}
 
     def __init__(self, **kwargs):
+        self.__dict__['listener'] = None
         self.__dict__.update((key, None) for key in Traits.ALLOWED_KEYS)
         self.__dict__.update((key, value) for key, value in kwargs.items() if key in Traits.ALLOWED_KEYS)
 
+    def __setattr__(self, key, value):
+        previous = self.__dict__.get(key)
+        self.__dict__[key] = value
+        if self.listener is not None and previous != value:
+            self.listener(key)
+
+    def watch(self, listener):
+        self.__dict__['listener'] = listener
+
     @classmethod
     def merge(cls, child, self_traits, default_traits):
         merged_traits = Traits()
@@ -0,0 +1,155 @@
+class TrieNode:
+
+    def __init__(self):
+        self.children = dict()
+        self.word = None
+        self.count = 0
+        self.completions = []
+
+
+class PrefixTrie:
+
+    MAX_COMPLETIONS = 10
+
+    def __init__(self):
+        self.root = TrieNode()
+
+    def __len__(self):
+        return self.root.count
+
+    def __contains__(self, word):
+        node = self.find_node(word)
+        return node is not None and node.word is not None
+
+    @staticmethod
+    def rank(word):
+        return len(word), word
+
+    def find_node(self, prefix):
+        node = self.root
+        for letter in prefix:
+            node = node.children.get(letter)
+            if node is None:
+                break
+        return node
+
+    def add(self, word):
+        path = [self.root]
+        node = self.root
+        for letter in word:
+            child = node.children.get(letter)
+            if child is None:
+                child = TrieNode()
+                node.children[letter] = child
+            node = child
+            path.append(node)
+        if node.word is not None:
+            return False
+        node.word = word
+        rank = PrefixTrie.rank(word)
+        for node in path:
+            node.count += 1
+            completions = node.completions
+            if len(completions) < PrefixTrie.MAX_COMPLETIONS or rank < PrefixTrie.rank(completions[-1]):
+                completions.append(word)
+                completions.sort(key=PrefixTrie.rank)
+                del completions[PrefixTrie.MAX_COMPLETIONS:]
+        return True
+
+    def remove(self, word):
+        path = [self.root]
+        node = self.root
+        for letter in word:
+            node = node.children.get(letter)
+            if node is None:
+                return False
+            path.append(node)
+        if node.word != word:
+            return False
+        node.word = None
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            node.count -= 1
+            if depth > 0 and node.count == 0:
+                del path[depth - 1].children[word[depth - 1]]
+            elif word in node.completions:
+                self.recompute_completions(node)
+        return True
+
+    @staticmethod
+    def recompute_completions(node):
+        completions = []
+        if node.word is not None:
+            completions.append(node.word)
+        for child in node.children.values():
+            completions.extend(child.completions)
+        completions.sort(key=PrefixTrie.rank)
+        node.completions = completions[:PrefixTrie.MAX_COMPLETIONS]
+
+    def unique_completion(self, prefix):
+        node = self.find_node(prefix)
+        if node is None or node.count != 1:
+            return None
+        while node.word is None:
+            node = next(iter(node.children.values()))
+        return node.word
+
+    def complete(self, prefix, limit=MAX_COMPLETIONS):
+        node = self.find_node(prefix)
+        if node is None:
+            return []
+        return node.completions[:limit]
+
+    def words(self, prefix):
+        node = self.find_node(prefix)
+        words = []
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            if node.word is not None:
+                words.append(node.word)
+            stack.extend(node.children.values())
+        return words
+
+
+class TrieOverlay:
+
+    def __init__(self, base):
+        self.base = base
+        self.added = PrefixTrie()
+        self.removed = set()
+
+    def __len__(self):
+        return len(self.base) - len(self.removed) + len(self.added)
+
+    def __contains__(self, word):
+        return word in self.added or (word in self.base and word not in self.removed)
+
+    def add(self, word):
+        if word in self.removed:
+            self.removed.discard(word)
+            return True
+        if word in self.base:
+            return False
+        return self.added.add(word)
+
+    def remove(self, word):
+        if word in self.added:
+            return self.added.remove(word)
+        if word in self.base and word not in self.removed:
+            self.removed.add(word)
+            return True
+        return False
+
+    def unique_completion(self, prefix):
+        completions = self.complete(prefix, 2)
+        return completions[0] if len(completions) == 1 else None
+
+    def complete(self, prefix, limit=PrefixTrie.MAX_COMPLETIONS):
+        removed = self.removed
+        completions = self.base.complete(prefix)
+        if removed and any(word in removed for word in completions):
+            completions = [word for word in self.base.words(prefix) if word not in removed]
+        completions = set(completions)
+        completions.update(self.added.complete(prefix, limit))
+        return sorted(completions, key=PrefixTrie.rank)[:limit]
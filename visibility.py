@@ -0,0 +1,57 @@
+from schema import Scope
+
+
+class VisibilityCache:
+
+    HELD = 'held'
+
+    def __init__(self, player):
+        self.player = player
+        self.vocabulary = player.vocabulary
+        self.entries = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def reachable(self, scope):
+        location = self.player.location
+        stamp = (location.version, self.player.inventory.version)
+        cached = self.entries.get(location.id)
+        if cached is not None and cached[0] == stamp:
+            scopes = cached[1]
+        else:
+            scopes = dict()
+            self.entries[location.id] = (stamp, scopes)
+        if scope in scopes:
+            self.hits += 1
+            return scopes[scope]
+        self.misses += 1
+        return self.compute_scope(location, scopes, scope)
+
+    def compute_scope(self, location, scopes, scope):
+        ids = scopes.get(scope)
+        if ids is not None:
+            return ids
+        if scope == Scope.INVENTORY:
+            ids = frozenset(self.player.inventory.items)
+        elif scope == Scope.PROXIMITY:
+            ids = self.compute_scope(location, scopes, Scope.INVENTORY).union(location.items)
+        elif scope == Scope.EXTERNAL:
+            ids = frozenset(location.items).union(self.compute_scope(location, scopes, VisibilityCache.HELD))
+        elif scope == Scope.NEARBY:
+            ids = self.compute_scope(location, scopes, Scope.PROXIMITY) \
+                .union(self.compute_scope(location, scopes, VisibilityCache.HELD))
+        else:
+            held = set()
+            for item_id in self.compute_scope(location, scopes, Scope.PROXIMITY):
+                thing = self.vocabulary.lookup_noun(item_id)
+                if thing is not self.player:
+                    held.update(thing.exposed_ids())
+            ids = frozenset(held)
+        scopes[scope] = ids
+        return ids
@@ -1,5 +1,11 @@
-DETERMINERS = {'the', 'a', 'an', 'some'}
-PREPOSITIONS = {'on', 'at', 'to', 'with', 'in', 'into', 'from', 'for', 'of'}
+import hashlib
+from array import array
+from types import MappingProxyType
+from trie import PrefixTrie, TrieOverlay
+from spelling import SpellingIndex, SpellingOverlay
+
+DETERMINERS = frozenset({'the', 'a', 'an', 'some'})
+PREPOSITIONS = frozenset({'on', 'at', 'to', 'with', 'in', 'into', 'from', 'for', 'of'})
 
 
 class PartOfSpeech:
@@ -11,49 +17,373 @@ class PartOfSpeech:
     values = {NOUN, VERB, ADJECTIVE}
 
 
+class Tag:
+
+    NOUN = 1 << PartOfSpeech.NOUN
+    VERB = 1 << PartOfSpeech.VERB
+    ADJECTIVE = 1 << PartOfSpeech.ADJECTIVE
+    DETERMINER = 1 << 3
+    PREPOSITION = 1 << 4
+
+    NONE = 0
+    KNOWN_WORD = NOUN | ADJECTIVE | DETERMINER | PREPOSITION
+
+
+class FrozenLexicon:
+
+    def __init__(self, vocabulary):
+        self.names = MappingProxyType(dict((pos, MappingProxyType(dict(vocabulary.names[pos])))
+                                           for pos in PartOfSpeech.values))
+        self.tags = MappingProxyType(dict(vocabulary.tags))
+        self.prefixes = MappingProxyType(dict(vocabulary.prefixes))
+        self.spellings = MappingProxyType(dict(vocabulary.spellings))
+        self.id_count = vocabulary.id_counter
+        self.entry_names = MappingProxyType(dict((catalog_id, (vocabulary.parts_of_speech[catalog_id], entry.name))
+                                                 for catalog_id, entry in vocabulary.entries.items()))
+        self.signature = vocabulary.signature()
+
+
 class Vocabulary:
 
+    ID_FORMAT = "{:0>6d}"
+    MIN_PREFIX_LENGTH = 3
+    MIN_CORRECTION_LENGTH = 3
+    COMPACTION_RATIO = 0.25
+    MIN_COMPACTION_SIZE = 64
+
     def __init__(self):
         self.id_counter = 0
+        self.entries = dict()
+        self.parts_of_speech = dict()
         self.catalogs = dict()
+        self.tombstones = dict()
+        self.names = dict()
+        self.tags = dict()
+        self.prefixes = dict()
+        self.spellings = dict()
+        self.classes = dict()
+        self.modifiers = dict()
+        self.frozen = None
+        self.adopting = False
+        self.version = 0
         self.reset()
 
     def reset(self):
+        self.version += 1
+        self.id_counter = 0
+        self.entries = dict()
+        self.parts_of_speech = dict()
         for pos in PartOfSpeech.values:
-            self.catalogs[pos] = {}
+            self.catalogs[pos] = array('L')
+            self.tombstones[pos] = 0
+            self.names[pos] = {}
+            self.prefixes[pos] = PrefixTrie()
+            self.spellings[pos] = SpellingIndex()
+        self.classes.clear()
+        self.modifiers.clear()
+        self.frozen = None
+        self.adopting = False
+        self.tags = dict()
+        for word in DETERMINERS:
+            self.set_tag(word, Tag.DETERMINER, True)
+        for word in PREPOSITIONS:
+            self.set_tag(word, Tag.PREPOSITION, True)
+
+    @classmethod
+    def format_id(cls, catalog_id):
+        return cls.ID_FORMAT.format(catalog_id)
+
+    @classmethod
+    def parse_id(cls, catalog_id):
+        if isinstance(catalog_id, str):
+            catalog_id = int(catalog_id)
+        return catalog_id
 
     def next_id(self):
         self.id_counter += 1
-        return "{:0>6d}".format(self.id_counter)
+        return self.id_counter
 
     def register(self, part_of_speech, entry):
         catalog_id = self.next_id()
-        self.catalogs[part_of_speech][catalog_id] = entry
+        self.entries[catalog_id] = entry
+        self.parts_of_speech[catalog_id] = part_of_speech
+        self.catalogs[part_of_speech].append(catalog_id)
+        if self.adopting and self.frozen.entry_names.get(catalog_id) != (part_of_speech, entry.name):
+            self.reindex()
+        self.index_name(part_of_speech, entry.name, catalog_id)
+        for alias in entry.aliases:
+            self.index_name(part_of_speech, alias, catalog_id)
+        if part_of_speech == PartOfSpeech.NOUN:
+            self.index_classes(entry, catalog_id)
         return catalog_id
 
+    def unregister(self, part_of_speech, catalog_id):
+        catalog_id = self.parse_id(catalog_id)
+        entry = self.lookup_by_id(part_of_speech, catalog_id)
+        del self.entries[catalog_id]
+        del self.parts_of_speech[catalog_id]
+        self.tombstones[part_of_speech] += 1
+        self.version += 1
+        self.unindex_name(part_of_speech, entry.name, catalog_id)
+        for alias in entry.aliases:
+            self.unindex_name(part_of_speech, alias, catalog_id)
+        if part_of_speech == PartOfSpeech.NOUN:
+            self.unindex_classes(entry, catalog_id)
+            self.unindex_modifiers(entry, catalog_id)
+        if self.should_compact(part_of_speech):
+            self.compact(part_of_speech)
+        return entry
+
+    def count(self, part_of_speech):
+        return len(self.catalogs[part_of_speech]) - self.tombstones[part_of_speech]
+
+    def should_compact(self, part_of_speech):
+        tombstones = self.tombstones[part_of_speech]
+        return tombstones >= Vocabulary.MIN_COMPACTION_SIZE \
+            and tombstones >= Vocabulary.COMPACTION_RATIO * len(self.catalogs[part_of_speech])
+
+    def compact(self, part_of_speech):
+        entries = self.entries
+        self.catalogs[part_of_speech] = array('L', (catalog_id for catalog_id in self.catalogs[part_of_speech]
+                                                    if catalog_id in entries))
+        self.tombstones[part_of_speech] = 0
+        self.entries = dict(entries)
+        self.parts_of_speech = dict(self.parts_of_speech)
+        if part_of_speech == PartOfSpeech.NOUN:
+            self.classes = dict((klass, dict(matches)) for klass, matches in self.classes.items())
+            self.modifiers = dict((key, dict(matches)) for key, matches in self.modifiers.items())
+
+    def is_registered(self, part_of_speech, catalog_id):
+        try:
+            self.lookup_by_id(part_of_speech, catalog_id)
+        except KeyError:
+            return False
+        return True
+
+    def add_alias(self, part_of_speech, catalog_id, alias):
+        if self.is_registered(part_of_speech, catalog_id):
+            self.index_name(part_of_speech, alias, catalog_id)
+
+    def writable_names(self, part_of_speech):
+        names = self.names[part_of_speech]
+        if type(names) is not dict:
+            names = dict(names)
+            self.names[part_of_speech] = names
+        return names
+
+    def writable_prefixes(self, part_of_speech):
+        prefixes = self.prefixes[part_of_speech]
+        if self.frozen is not None and prefixes is self.frozen.prefixes[part_of_speech]:
+            prefixes = TrieOverlay(prefixes)
+            self.prefixes[part_of_speech] = prefixes
+        return prefixes
+
+    def writable_spellings(self, part_of_speech):
+        spellings = self.spellings[part_of_speech]
+        if self.frozen is not None and spellings is self.frozen.spellings[part_of_speech]:
+            spellings = SpellingOverlay(spellings)
+            self.spellings[part_of_speech] = spellings
+        return spellings
+
+    def index_name(self, part_of_speech, name, catalog_id):
+        if self.adopting:
+            return
+        catalog_id = self.parse_id(catalog_id)
+        ids = self.names[part_of_speech].get(name)
+        if ids is None:
+            self.writable_prefixes(part_of_speech).add(name)
+            self.writable_spellings(part_of_speech).add(name)
+            self.set_tag(name, 1 << part_of_speech, True)
+            self.writable_names(part_of_speech)[name] = (catalog_id,)
+        elif catalog_id not in ids:
+            self.writable_names(part_of_speech)[name] = ids + (catalog_id,)
+        else:
+            return
+        self.version += 1
+
+    def unindex_name(self, part_of_speech, name, catalog_id):
+        catalog_id = self.parse_id(catalog_id)
+        ids = self.names[part_of_speech].get(name)
+        if ids is None or catalog_id not in ids:
+            return
+        self.version += 1
+        names = self.writable_names(part_of_speech)
+        if len(ids) > 1:
+            names[name] = tuple(i for i in ids if i != catalog_id)
+        else:
+            del names[name]
+            self.writable_prefixes(part_of_speech).remove(name)
+            self.writable_spellings(part_of_speech).remove(name)
+            self.set_tag(name, 1 << part_of_speech, False)
+
+    def word_tags(self, word):
+        return self.tags.get(word, Tag.NONE)
+
+    def set_tag(self, word, tag, enabled):
+        tags = self.word_tags(word)
+        if enabled:
+            updated_tags = tags | tag
+        else:
+            updated_tags = tags & ~tag
+        if updated_tags != tags:
+            if type(self.tags) is not dict:
+                self.tags = dict(self.tags)
+            self.tags[word] = updated_tags
+
+    def index_classes(self, entry, catalog_id):
+        catalog_id = self.parse_id(catalog_id)
+        for klass in type(entry).__mro__:
+            self.classes.setdefault(klass, {})[catalog_id] = entry
+
+    def unindex_classes(self, entry, catalog_id):
+        catalog_id = self.parse_id(catalog_id)
+        for klass in type(entry).__mro__:
+            entries = self.classes.get(klass)
+            if entries is not None:
+                entries.pop(catalog_id, None)
+                if len(entries) == 0:
+                    del self.classes[klass]
+
+    def index_modifier(self, noun, adjective, thing):
+        self.version += 1
+        self.modifiers.setdefault((noun, adjective), {})[self.parse_id(thing.id)] = thing
+
+    def unindex_modifiers(self, thing, catalog_id):
+        catalog_id = self.parse_id(catalog_id)
+        self.version += 1
+        for noun in [thing.name] + thing.aliases:
+            for adjective in thing.modifier_names:
+                entries = self.modifiers.get((noun, adjective))
+                if entries is not None:
+                    entries.pop(catalog_id, None)
+                    if len(entries) == 0:
+                        del self.modifiers[(noun, adjective)]
+
+    def lookup_by_modifiers(self, noun, adjectives):
+        candidate_sets = []
+        for adjective in adjectives:
+            entries = self.modifiers.get((noun, adjective))
+            if entries is None:
+                return []
+            candidate_sets.append(entries)
+        if len(candidate_sets) == 0:
+            return self.lookup_noun_by_name(noun)
+        candidate_sets.sort(key=len)
+        candidate_ids = set(candidate_sets[0].keys())
+        for entries in candidate_sets[1:]:
+            candidate_ids.intersection_update(entries.keys())
+        return [self.entries[catalog_id] for catalog_id in sorted(candidate_ids)]
+
     def lookup_by_id(self, part_of_speech, catalog_id):
-        return self.catalogs[part_of_speech][catalog_id]
+        if type(catalog_id) is not int:
+            try:
+                catalog_id = self.parse_id(catalog_id)
+            except (TypeError, ValueError):
+                raise KeyError(catalog_id)
+        entry = self.entries.get(catalog_id)
+        if entry is None or self.parts_of_speech[catalog_id] != part_of_speech:
+            raise KeyError(catalog_id)
+        return entry
 
     def lookup_by_name(self, part_of_speech, name):
+        ids = self.names[part_of_speech].get(name)
+        if ids is None:
+            return []
+        entries = self.entries
+        if len(ids) == 1 and not self.adopting:
+            return [entries[ids[0]]]
+        limit = self.id_counter
         matches = []
-        for entry in self.catalogs[part_of_speech].values():
-            if name == entry.name or name in entry.aliases:
-                matches.append(entry)
+        for catalog_id in ids:
+            if catalog_id <= limit:
+                matches.append(entries[catalog_id])
         return matches
 
     def is_valid_part_of_speech(self, part_of_speech, lookup_term):
-        return len(self.lookup_by_name(part_of_speech, lookup_term)) > 0
+        if self.adopting:
+            return len(self.lookup_by_name(part_of_speech, lookup_term)) > 0
+        return lookup_term in self.names[part_of_speech]
+
+    def adopt(self, lexicon):
+        self.frozen = lexicon
+        self.names = dict(lexicon.names)
+        self.tags = lexicon.tags
+        self.prefixes = dict(lexicon.prefixes)
+        self.spellings = dict(lexicon.spellings)
+        self.adopting = True
+
+    def reindex(self):
+        self.frozen = None
+        self.adopting = False
+        self.tags = dict()
+        for word in DETERMINERS:
+            self.set_tag(word, Tag.DETERMINER, True)
+        for word in PREPOSITIONS:
+            self.set_tag(word, Tag.PREPOSITION, True)
+        for pos in PartOfSpeech.values:
+            self.names[pos] = {}
+            self.prefixes[pos] = PrefixTrie()
+            self.spellings[pos] = SpellingIndex()
+        for catalog_id, entry in list(self.entries.items()):
+            pos = self.parts_of_speech[catalog_id]
+            for name in [entry.name] + list(entry.aliases):
+                self.index_name(pos, name, catalog_id)
+
+    def signature(self):
+        digest = hashlib.sha1()
+        for catalog_id in sorted(self.entries):
+            entry = self.entries[catalog_id]
+            digest.update(repr((catalog_id, self.parts_of_speech[catalog_id], entry.name,
+                                tuple(entry.aliases))).encode())
+        return len(self.entries), digest.hexdigest()
+
+    def freeze(self):
+        if self.adopting:
+            self.adopting = False
+            if self.id_counter == self.frozen.id_count and self.signature() == self.frozen.signature:
+                return self.frozen
+            self.reindex()
+        if self.frozen is None:
+            self.frozen = FrozenLexicon(self)
+            self.names = dict(self.frozen.names)
+            self.tags = self.frozen.tags
+        return self.frozen
+
+    def expand_prefix(self, part_of_speech, prefix):
+        if len(prefix) < Vocabulary.MIN_PREFIX_LENGTH:
+            return None
+        return self.prefixes[part_of_speech].unique_completion(prefix)
+
+    def complete(self, prefix, parts_of_speech=PartOfSpeech.values, limit=PrefixTrie.MAX_COMPLETIONS):
+        completions = set()
+        for pos in parts_of_speech:
+            completions.update(self.prefixes[pos].complete(prefix, limit))
+        return sorted(completions, key=PrefixTrie.rank)[:limit]
+
+    def suggest_spelling(self, word, parts_of_speech=PartOfSpeech.values):
+        if len(word) < Vocabulary.MIN_CORRECTION_LENGTH:
+            return []
+        suggestions = set()
+        for pos in parts_of_speech:
+            suggestions.update(s for s in self.spellings[pos].suggest(word)
+                               if len(s) >= Vocabulary.MIN_CORRECTION_LENGTH)
+        return sorted(suggestions)
 
     def get_objects(self):
-        noun_catalog = self.catalogs[PartOfSpeech.NOUN]
-        return [self.lookup_by_id(PartOfSpeech.NOUN, catalog_id) for catalog_id in noun_catalog.keys()]
+        entries = self.entries
+        return [entries[catalog_id] for catalog_id in self.catalogs[PartOfSpeech.NOUN]
+                if catalog_id in entries]
 
     def get_objects_of_class(self, klass):
-        return [x for x in self.get_objects() if isinstance(x, klass)]
+        entries = self.classes.get(klass)
+        if entries is None:
+            return []
+        return list(entries.values())
 
     def get_valid_verbs(self):
-        verb_catalog = self.catalogs[PartOfSpeech.VERB]
-        return [verb_catalog[v].name for v in verb_catalog.keys()]
+        entries = self.entries
+        return [entries[catalog_id].name for catalog_id in self.catalogs[PartOfSpeech.VERB]
+                if catalog_id in entries]
 
     def is_preposition(self, word):
         return word in PREPOSITIONS
@@ -64,6 +394,12 @@ class Vocabulary:
     def register_noun(self, thing):
         return self.register(PartOfSpeech.NOUN, thing)
 
+    def unregister_noun(self, thing):
+        return self.unregister(PartOfSpeech.NOUN, thing.id)
+
+    def add_noun_alias(self, catalog_id, alias):
+        self.add_alias(PartOfSpeech.NOUN, catalog_id, alias)
+
     def is_noun(self, lookup_term):
         return self.is_valid_part_of_speech(PartOfSpeech.NOUN, lookup_term)
 
@@ -76,8 +412,14 @@ class Vocabulary:
     def register_verb(self, action):
         return self.register(PartOfSpeech.VERB, action)
 
+    def add_verb_alias(self, catalog_id, alias):
+        self.add_alias(PartOfSpeech.VERB, catalog_id, alias)
+
     def is_verb(self, lookup_term):
-        return self.is_valid_part_of_speech(PartOfSpeech.VERB, lookup_term)
+        return lookup_term in self.names[PartOfSpeech.VERB]
+
+    def lookup_verb(self, lookup_term):
+        return self.lookup_by_id(PartOfSpeech.VERB, lookup_term)
 
     def lookup_verb_by_name(self, lookup_term):
         return self.lookup_by_name(PartOfSpeech.VERB, lookup_term)[0]
@@ -88,5 +430,8 @@ class Vocabulary:
     def is_adjective(self, lookup_term):
         return self.is_valid_part_of_speech(PartOfSpeech.ADJECTIVE, lookup_term)
 
+    def lookup_adjective_by_name(self, lookup_term):
+        return self.lookup_by_name(PartOfSpeech.ADJECTIVE, lookup_term)
+
     def lookup_adjective(self, lookup_term):
         return self.lookup_by_id(PartOfSpeech.ADJECTIVE, lookup_term)
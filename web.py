@@ -1,7 +1,13 @@
+from collections import OrderedDict
+from threading import Lock
+from uuid import uuid4
 from flask import render_template
+from flask import request
+from flask import jsonify
 from flask import Flask
 from route import Route
 from game import Game
+from vocabulary import PartOfSpeech
 
 
 class WebRoute(Route):
@@ -23,15 +29,57 @@ class WebRoute(Route):
 
 
 app = Flask(__name__)
+sessions = OrderedDict()
+sessions_lock = Lock()
+shared_lexicon = None
+# Each session holds a whole Game (roughly 300 KiB with a shared lexicon),
+# so this caps session memory at about 60 MiB.
+MAX_SESSIONS = 200
+
+
+def start_session(game):
+    session_id = uuid4().hex
+    with sessions_lock:
+        sessions[session_id] = game
+        if len(sessions) > MAX_SESSIONS:
+            sessions.popitem(last=False)
+    return session_id
+
+
+def find_session(session_id):
+    with sessions_lock:
+        game = sessions.get(session_id)
+        if game is not None:
+            sessions.move_to_end(session_id)
+    return game
 
 
 @app.route("/")
 @app.route("/game")
 def game_controller():
+    global shared_lexicon
     route = WebRoute()
-    game = Game(name='Adventure Quest', route=route)
+    game = Game(name='Adventure Quest', route=route, lexicon=shared_lexicon)
+    shared_lexicon = game.lexicon
+    session_id = start_session(game)
     game.init_game()
-    return render_template('game.html', banner=route.banner, hello='Hello')
+    return render_template('game.html', banner=route.banner, hello='Hello', session=session_id)
+
+
+@app.route("/complete")
+def completion_controller():
+    game = find_session(request.args.get('session', ''))
+    if game is None:
+        return jsonify([]), 404
+    words = request.args.get('input', '').split()
+    if len(words) == 0:
+        return jsonify([])
+    if len(words) == 1:
+        parts_of_speech = {PartOfSpeech.VERB}
+    else:
+        parts_of_speech = {PartOfSpeech.NOUN, PartOfSpeech.ADJECTIVE}
+    completions = game.vocabulary.complete(words[-1], parts_of_speech)
+    return jsonify(completions)
 
 
 if __name__ == "__main__":